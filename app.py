@@ -4,13 +4,57 @@ Learn Python with Tests - Web Application
 A browser-based version of the Python TDD training course.
 """
 
+import io
 import os
-import subprocess
+import sys
+import hashlib
+import threading
+import contextlib
+import multiprocessing
+import click
+import orjson
 import markdown
-from flask import Flask, render_template, request, jsonify, send_from_directory
+import pytest
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from functools import lru_cache
+from flask import Flask, Response, current_app, render_template, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from pathlib import Path
 
-app = Flask(__name__, static_folder='.', static_url_path='')
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, used by jsonify() for API responses."""
+    
+    def _dumps_bytes(self, obj, sort_keys=None, indent=None, default=None, **kwargs):
+        # Map the json.dumps options Flask passes onto orjson's flags; jsonify sorts keys by default
+        option = 0
+        if self.sort_keys if sort_keys is None else sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default or self.default, option=option)
+    
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj, **kwargs).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        indent = (self.compact is None and current_app.debug) or self.compact is False
+        # Hand orjson's bytes straight to the response, skipping a decode/encode round trip
+        return current_app.response_class(self._dumps_bytes(obj, indent=indent), mimetype=self.mimetype)
+
+# Static files are served by explicit routes below (or by Nginx in production,
+# see deploy/nginx.conf) rather than exposing the whole repository root.
+app = Flask(__name__, static_folder=None)
+app.json = OrjsonProvider(app)
+
+# Hand code downloads to Nginx's sendfile path via X-Accel-Redirect when deployed behind it
+app.config['USE_X_ACCEL_REDIRECT'] = os.environ.get('USE_X_ACCEL_REDIRECT') == '1'
 
 # Course structure
 COURSE_STRUCTURE = {
@@ -41,56 +85,131 @@ COURSE_STRUCTURE = {
     ]
 }
 
+# Content roots, resolved once; user-supplied paths must stay inside them
+BASE_DIR = Path(app.root_path).resolve()
+SOURCE_ROOT = BASE_DIR / 'source'
+CONTENT_ROOT = BASE_DIR / 'content'
+BUILD_DIR = BASE_DIR / 'build'
+
+# One Markdown parser, built once: extension setup and regex compilation are not repeated per render.
+# Chapter code blocks are all fenced with a language, so codehilite skips lexer guessing, and
+# the formatter class is passed directly instead of being looked up by name for every block.
+_markdown = markdown.Markdown(
+    extensions=['codehilite', 'fenced_code'],
+    extension_configs={'codehilite': {'guess_lang': False, 'pygments_formatter': HtmlFormatter}},
+    output_format='html5'
+)
+# Import the lexers the course uses now rather than on the first request
+for _lang in ('python', 'bash'):
+    get_lexer_by_name(_lang)
+_markdown_lock = threading.Lock()
+
+# Seconds a chapter's test run may take before it is abandoned
+TEST_TIMEOUT = 30
+
+# Processes in each web worker's pytest pool; by default the CPUs are shared
+# between the gunicorn workers (WEB_CONCURRENCY, see Procfile) rather than each taking all of them
+TEST_POOL_SIZE = int(os.environ.get('TEST_POOL_SIZE') or
+                     max(1, (os.cpu_count() or 1) // int(os.environ.get('WEB_CONCURRENCY', 4))))
+
+# Long-lived pytest workers keep imports warm while isolating the app from
+# student code; created lazily so pool workers importing this module don't nest pools.
+_test_pool = None
+_test_pool_lock = threading.Lock()
+
+# Browser cache lifetime for CSS/JS assets, in seconds
+ASSET_MAX_AGE = 7 * 24 * 3600
+
+# Browser cache lifetime for code downloads before revalidating, in seconds
+CODE_MAX_AGE = 60
+
+# File types exposed through the code viewer
+CODE_EXTENSIONS = {'.py', '.md'}
+
+# Flat path -> chapter lookup, built once instead of scanning every section per request
+CHAPTER_INDEX = {entry['path']: entry for section in COURSE_STRUCTURE.values() for entry in section}
+
+# COURSE_STRUCTURE is immutable, so its JSON form is serialized once
+COURSE_JSON = orjson.dumps(COURSE_STRUCTURE)
+COURSE_JSON_ETAG = hashlib.sha1(COURSE_JSON).hexdigest()
+
+def _safe_under(root, relative_path):
+    """Resolve relative_path under root, or return None if it escapes root."""
+    path = (root / relative_path).resolve()
+    return path if path.is_relative_to(root) else None
+
+@lru_cache(maxsize=None)
+def _index_page():
+    """Render the course index once; COURSE_STRUCTURE never changes at runtime."""
+    html = render_template('index.html', course_structure=COURSE_STRUCTURE)
+    return html, hashlib.sha1(html.encode('utf-8')).hexdigest()
+
 @app.route('/')
 def index():
     """Main course page."""
-    return render_template('index.html', course_structure=COURSE_STRUCTURE)
+    if app.debug:
+        # Pick up template edits while developing
+        _index_page.cache_clear()
+    
+    html, etag = _index_page()
+    response = Response(html, mimetype='text/html')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+@app.route('/course.json')
+def course_json():
+    """Course structure as JSON, for clients and static builds."""
+    response = Response(COURSE_JSON, mimetype='application/json')
+    response.set_etag(COURSE_JSON_ETAG)
+    return response.make_conditional(request)
+
+@app.cli.command('build')
+def build():
+    """Write the pre-rendered index page and course JSON to build/ for static hosting."""
+    BUILD_DIR.mkdir(exist_ok=True)
+    (BUILD_DIR / 'index.html').write_text(_index_page()[0], encoding='utf-8')
+    (BUILD_DIR / 'course.json').write_bytes(COURSE_JSON)
+    click.echo(f"Wrote index.html and course.json to {BUILD_DIR}")
+
+@app.route('/<any(css, javascript):asset_dir>/<path:filename>')
+def assets(asset_dir, filename):
+    """Serve front-end assets when running without a reverse proxy."""
+    return send_from_directory(asset_dir, filename, max_age=ASSET_MAX_AGE)
+
+@lru_cache(maxsize=256)
+def _render_chapter(file_path, mtime_ns):
+    """Read and render a chapter file. Cached until the file's mtime changes."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    
+    if file_path.endswith('.md'):
+        # Markdown instances keep per-document state, so the shared one is used under a lock
+        with _markdown_lock:
+            return _markdown.reset().convert(text)
+    return text
 
 @app.route('/chapter/<path:chapter_path>')
 def chapter(chapter_path):
     """Display a specific chapter."""
-    # First try to load from content directory (new template-based approach)
-    content_path = Path('content') / f'{chapter_path}.html'
-    
-    if content_path.exists():
-        # Read HTML content from content directory
-        with open(content_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Get chapter info
-        chapter_info = None
-        for section in COURSE_STRUCTURE.values():
-            for chapter in section:
-                if chapter['path'] == chapter_path:
-                    chapter_info = chapter
-                    break
-        
-        return render_template('chapter.html', 
-                             content=html_content, 
-                             chapter_path=chapter_path,
-                             chapter_info=chapter_info,
-                             course_structure=COURSE_STRUCTURE)
+    not_found = f"Chapter '{chapter_path}' not found", 404
     
-    # Fallback to old markdown approach
-    chapter_dir = Path(chapter_path)
-    readme_path = chapter_dir / 'README.md'
+    # Prefer the pre-rendered content directory, fall back to the old markdown approach
+    content_path = _safe_under(CONTENT_ROOT, f'{chapter_path}.html')
+    if content_path is None:
+        return not_found
+    if not content_path.exists():
+        content_path = _safe_under(BASE_DIR, f'{chapter_path}/README.md')
+        if content_path is None:
+            return not_found
     
-    if not readme_path.exists():
-        return f"Chapter '{chapter_path}' not found", 404
-    
-    # Read and convert markdown to HTML
-    with open(readme_path, 'r', encoding='utf-8') as f:
-        markdown_content = f.read()
+    try:
+        mtime_ns = content_path.stat().st_mtime_ns
+    except OSError:
+        return not_found
     
-    html_content = markdown.markdown(markdown_content, extensions=['codehilite', 'fenced_code'])
+    html_content = _render_chapter(str(content_path), mtime_ns)
     
-    # Get chapter info
-    chapter_info = None
-    for section in COURSE_STRUCTURE.values():
-        for chapter in section:
-            if chapter['path'] == chapter_path:
-                chapter_info = chapter
-                break
+    chapter_info = CHAPTER_INDEX.get(chapter_path)
     
     return render_template('chapter.html', 
                          content=html_content, 
@@ -98,68 +217,119 @@ def chapter(chapter_path):
                          chapter_info=chapter_info,
                          course_structure=COURSE_STRUCTURE)
 
+def _get_test_pool():
+    """Return the shared pytest worker pool, starting it on first use."""
+    global _test_pool
+    with _test_pool_lock:
+        if _test_pool is None:
+            context = multiprocessing.get_context('forkserver')
+            _test_pool = context.Pool(TEST_POOL_SIZE)
+        return _test_pool
+
+def _discard_test_pool(pool):
+    """Kill a pool whose worker is stuck in a run; the next request starts a fresh one."""
+    global _test_pool
+    with _test_pool_lock:
+        if _test_pool is pool:
+            _test_pool = None
+    pool.terminate()
+
+def _run_pytest(chapter_dir):
+    """Run a chapter's tests in a pool worker and return (returncode, stdout, stderr)."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    # Tests resolve relative paths against the chapter, as they would from its directory
+    os.chdir(chapter_dir)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            # Students see plain results: no pytest-run-parallel stress runs or banner
+            returncode = pytest.main(['-v', '--tb=short', '--capture=sys', '-p', 'no:run-parallel',
+                                      '--rootdir', chapter_dir, chapter_dir])
+    finally:
+        # Forget the chapter's own modules so edits are picked up on the next run
+        prefix = chapter_dir + os.sep
+        for name, module in list(sys.modules.items()):
+            if (getattr(module, '__file__', None) or '').startswith(prefix):
+                del sys.modules[name]
+    
+    return int(returncode), stdout.getvalue(), stderr.getvalue()
+
 @app.route('/run-tests/<path:chapter_path>')
 def run_tests(chapter_path):
     """Run tests for a specific chapter."""
-    chapter_dir = Path('source') / chapter_path
+    chapter_dir = _safe_under(SOURCE_ROOT, chapter_path)
     
-    if not chapter_dir.exists():
+    if chapter_dir is None or not chapter_dir.is_dir():
         return jsonify({"error": "Chapter not found"}), 404
     
     try:
-        # Change to chapter directory and run tests
-        result = subprocess.run(
-            ['pytest', '-v', '--tb=short'],
-            cwd=chapter_dir,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        pool = _get_test_pool()
+        result = pool.apply_async(_run_pytest, (str(chapter_dir),))
+        try:
+            returncode, stdout, stderr = result.get(timeout=TEST_TIMEOUT)
+        except multiprocessing.TimeoutError:
+            _discard_test_pool(pool)
+            raise
         
         return jsonify({
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "success": result.returncode == 0
+            "returncode": returncode,
+            "stdout": stdout,
+            "stderr": stderr,
+            "success": returncode == 0
         })
-    except subprocess.TimeoutExpired:
+    except multiprocessing.TimeoutError:
         return jsonify({"error": "Tests timed out"}), 500
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/code/<path:chapter_path>/<filename>')
 def get_code(chapter_path, filename):
-    """Get code files for a chapter."""
-    chapter_dir = Path('source') / chapter_path
-    file_path = chapter_dir / filename
+    """Stream a code file for a chapter as plain text."""
+    if Path(filename).suffix not in CODE_EXTENSIONS:
+        return "File not found", 404
     
-    if not file_path.exists():
+    chapter_dir = _safe_under(SOURCE_ROOT, chapter_path)
+    if chapter_dir is None:
         return "File not found", 404
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    if app.config['USE_X_ACCEL_REDIRECT']:
+        response = Response(mimetype='text/plain')
+        relative_dir = chapter_dir.relative_to(SOURCE_ROOT).as_posix()
+        response.headers['X-Accel-Redirect'] = f'/_source/{relative_dir}/{filename}'
+        return response
     
-    return jsonify({"content": content})
+    # send_from_directory streams via wsgi.file_wrapper; conditional=True adds ETag and
+    # Last-Modified from the file's mtime and size, so unchanged files come back as 304s
+    response = send_from_directory(chapter_dir, filename, mimetype='text/plain',
+                                   conditional=True, max_age=CODE_MAX_AGE)
+    response.cache_control.must_revalidate = True
+    return response
+
+def _code_file_listing(chapter_dir):
+    """Name, size and modification time of each code file directly in chapter_dir."""
+    files = []
+    # DirEntry caches its type from the directory read and its stat() result after the first call
+    with os.scandir(chapter_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and os.path.splitext(entry.name)[1] in CODE_EXTENSIONS:
+                stat = entry.stat()
+                files.append({"name": entry.name, "size": stat.st_size, "modified": stat.st_mtime})
+    return files
 
 @app.route('/list-files/<path:chapter_path>')
 def list_files(chapter_path):
     """List all files in a chapter directory."""
-    chapter_dir = Path('source') / chapter_path
-    
-    if not chapter_dir.exists():
+    chapter_dir = _safe_under(SOURCE_ROOT, chapter_path)
+    if chapter_dir is None:
         return jsonify({"error": "Chapter not found"}), 404
     
-    files = []
-    for file_path in chapter_dir.iterdir():
-        if file_path.is_file() and file_path.suffix in ['.py', '.md']:
-            files.append({
-                "name": file_path.name,
-                "size": file_path.stat().st_size,
-                "modified": file_path.stat().st_mtime
-            })
+    try:
+        files = _code_file_listing(chapter_dir)
+    except OSError:
+        return jsonify({"error": "Chapter not found"}), 404
     
-    return jsonify({"files": files})
+    return Response(orjson.dumps({"files": files}), mimetype='application/json')
 
+# Development server only; production runs under gunicorn (see Procfile)
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
 
@@ -90,7 +90,8 @@ async function loadCodeFiles(chapterPath) {
 async function loadFile(filename, chapterPath) {
     try {
         const response = await fetch(`/code/${chapterPath}/${filename}`);
-        const data = await response.json();
+        if (!response.ok) throw new Error(`HTTP ${response.status}`);
+        const content = await response.text();
         
         const modal = document.createElement('div');
         modal.className = 'modal fade';
@@ -102,7 +103,7 @@ async function loadFile(filename, chapterPath) {
                         <button type="button" class="btn-close" data-bs-dismiss="modal"></button>
                     </div>
                     <div class="modal-body">
-                        <pre><code class="language-python">${data.content}</code></pre>
+                        <pre><code class="language-python">${content}</code></pre>
                     </div>
                 </div>
             </div>
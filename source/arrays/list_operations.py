@@ -1,6 +1,9 @@
 class ListOperations:
     """
     A class that provides various list operations.
+    
+    The class holds no state and every method returns a new list, so a single
+    instance can be shared between threads.
     """
     
     def append(self, lst, item):
@@ -129,13 +132,8 @@ class ListOperations:
         if not isinstance(lst, list):
             raise TypeError("Argument must be a list")
         
-        seen = set()
-        result = []
-        for item in lst:
-            if item not in seen:
-                seen.add(item)
-                result.append(item)
-        return result
+        # dicts keep insertion order, so this keeps the first occurrence of each item
+        return list(dict.fromkeys(lst))
     
     def sort_list(self, lst):
         """
@@ -179,9 +177,9 @@ class ListOperations:
         if not isinstance(lst1, list) or not isinstance(lst2, list):
             raise TypeError("Both arguments must be lists")
         
-        set1 = set(lst1)
-        set2 = set(lst2)
-        return list(set1.intersection(set2))
+        # One lookup set; walking lst1 keeps its order and dict.fromkeys drops repeats
+        lookup = set(lst2)
+        return [item for item in dict.fromkeys(lst1) if item in lookup]
     
     def union(self, lst1, lst2):
         """
@@ -197,7 +195,6 @@ class ListOperations:
         if not isinstance(lst1, list) or not isinstance(lst2, list):
             raise TypeError("Both arguments must be lists")
         
-        set1 = set(lst1)
-        set2 = set(lst2)
-        return list(set1.union(set2))
+        # First occurrence wins, so items keep the order they appear in lst1 then lst2
+        return list(dict.fromkeys(lst1 + lst2))
 
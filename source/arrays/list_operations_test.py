@@ -66,3 +66,13 @@ def test_union():
     result = ops.union([1, 2, 3], [3, 4, 5])
     assert result == [1, 2, 3, 4, 5]
 
+
+def test_intersection_keeps_first_list_order():
+    ops = ListOperations()
+    result = ops.intersection(["c", "a", "b", "a"], ["a", "b", "c"])
+    assert result == ["c", "a", "b"]
+
+def test_union_keeps_first_seen_order():
+    ops = ListOperations()
+    result = ops.union(["b", "a"], ["c", "a"])
+    assert result == ["b", "a", "c"]
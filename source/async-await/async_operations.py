@@ -1,3 +1,6 @@
+import asyncio
+
+
 class AsyncOperations:
     """
     A class for learning asynchronous programming through TDD.
@@ -12,6 +15,12 @@ class AsyncOperations:
     Start by running the tests to see what needs to be implemented!
     """
     
+    # Upper bound on in-flight fetches so large URL lists don't exhaust sockets
+    MAX_CONCURRENT_FETCHES = 32
+    
+    # Simulated network round-trip time for fetch_data, in seconds
+    FETCH_LATENCY = 0.01
+    
     def __init__(self):
         """Initialize the AsyncOperations class."""
         pass
@@ -32,11 +41,18 @@ class AsyncOperations:
     
     async def fetch_data(self, url):
         """Simulate fetching data from a URL."""
-        pass
+        # Awaiting the "network" yields to the event loop, so concurrent fetches overlap.
+        # With a real HTTP client this would be `async with session.get(url)` on a shared session.
+        await asyncio.sleep(self.FETCH_LATENCY)
+        return {"url": url, "data": f"Data from {url}"}
     
     async def fetch_multiple_urls(self, urls):
         """Fetch data from multiple URLs concurrently."""
-        pass
+        # gather runs the fetches together: total time is max(T_i), not sum(T_i)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        return await asyncio.gather(
+            *(self.async_with_semaphore(semaphore, self.fetch_data(url)) for url in urls)
+        )
     
     async def process_data_async(self, data):
         """Process data asynchronously."""
@@ -64,4 +80,5 @@ class AsyncOperations:
     
     async def async_with_semaphore(self, semaphore, coro):
         """Run coroutine with semaphore limit."""
-        pass
+        async with semaphore:
+            return await coro
@@ -1,4 +1,9 @@
 class Account:
+    # Not thread-safe: `self.balance += amount` is a read-modify-write, so
+    # concurrent deposits/withdrawals on one account need a lock around them.
+    # Fixed attribute slots: no per-instance __dict__, smaller objects, faster attribute access
+    __slots__ = ('owner', 'balance')
+    
     def __init__(self, owner, balance):
         self.owner = owner
         self.balance = balance
@@ -1,3 +1,4 @@
+import pytest
 from account import Account
 
 def test_account_creation():
@@ -15,6 +16,7 @@ def test_withdraw():
     account.withdraw(300)
     assert account.balance == 700
 
-
-
-
+def test_account_has_fixed_attributes():
+    account = Account("John", 1000)
+    with pytest.raises(AttributeError):
+        account.nickname = "Johnny"
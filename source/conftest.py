@@ -0,0 +1,13 @@
+import pytest
+
+# Chapters whose tests also run from 8 threads x 10 iterations (pytest-run-parallel)
+# to catch shared-state bugs before the code meets a free-threaded (no-GIL) interpreter
+PARALLEL_CHAPTERS = {'arrays', 'classes'}
+
+def pytest_collection_modifyitems(config, items):
+    if not config.pluginmanager.has_plugin('run-parallel'):
+        return
+    for item in items:
+        if item.path.parent.name in PARALLEL_CHAPTERS:
+            item.add_marker(pytest.mark.force_parallel_threads(8))
+            item.add_marker(pytest.mark.iterations(10))
@@ -1,18 +1,35 @@
+import os
 import time
+import tempfile
+import itertools
 import threading
 import logging
 from typing import List, Optional, Any, Generator
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, ExitStack
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library modules only create their logger; the application entry point configures handlers
 logger = logging.getLogger(__name__)
 
+# Read buffer for file helpers: 128 KiB means fewer read() syscalls than io.DEFAULT_BUFFER_SIZE
+READ_BUFFER_SIZE = 128 * 1024
+
+def _write_all(fd: int, data: bytes):
+    """Write all of data to a raw file descriptor, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
 class DatabaseConnection:
     """
     A database connection context manager with proper error handling.
     """
     
+    __slots__ = ('database_name', 'connection_timeout', '_connected', '_connection_id')
+    
+    _next_id = itertools.count(1)
+    
     def __init__(self, database_name: str, connection_timeout: float = 5.0):
         self.database_name = database_name
         self.connection_timeout = connection_timeout
@@ -23,26 +40,20 @@ class DatabaseConnection:
         if not self.database_name:
             raise ValueError("Database name cannot be empty")
         
-        start_time = time.time()
-        while time.time() - start_time < self.connection_timeout:
-            try:
-                self._connection_id = f"conn_{int(time.time())}"
-                self._connected = True
-                logger.info(f"Connected to database: {self.database_name} (ID: {self._connection_id})")
-                return self
-            except Exception as e:
-                logger.warning(f"Connection attempt failed: {e}")
-                time.sleep(0.1)
-        
-        raise ConnectionError(f"Failed to connect to {self.database_name} within {self.connection_timeout} seconds")
+        # The simulated connect always succeeds, so there is nothing to retry or time out.
+        # IDs come from a counter so two connections opened in the same second stay distinct.
+        self._connection_id = f"conn_{next(DatabaseConnection._next_id)}"
+        self._connected = True
+        logger.info("Connected to database: %s (ID: %s)", self.database_name, self._connection_id)
+        return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._connected = False
-        logger.info(f"Disconnected from database: {self.database_name} (ID: {self._connection_id})")
+        logger.info("Disconnected from database: %s (ID: %s)", self.database_name, self._connection_id)
         
         # Handle exceptions
         if exc_type is not None:
-            logger.error(f"Database operation failed: {exc_val}")
+            logger.error("Database operation failed: %s", exc_val)
         
         return False  # Don't suppress exceptions
     
@@ -70,40 +81,53 @@ class FileManager:
     A file context manager with enhanced error handling.
     """
     
-    def __init__(self, filename: str, mode: str = 'r', encoding: str = 'utf-8'):
+    __slots__ = ('filename', 'mode', 'encoding', 'buffering', 'file')
+    
+    def __init__(self, filename: str, mode: str = 'r', encoding: str = 'utf-8',
+                 buffering: int = READ_BUFFER_SIZE):
         self.filename = filename
         self.mode = mode
         self.encoding = encoding
+        self.buffering = buffering
         self.file = None
     
     def __enter__(self):
         try:
-            self.file = open(self.filename, self.mode, encoding=self.encoding)
-            logger.info(f"Opened file: {self.filename} in mode: {self.mode}")
+            if 'b' in self.mode:
+                # Binary mode: raw bytes, no text decoding layer
+                self.file = open(self.filename, self.mode, buffering=self.buffering)
+            else:
+                self.file = open(self.filename, self.mode, buffering=self.buffering,
+                                 encoding=self.encoding)
+            logger.info("Opened file: %s in mode: %s", self.filename, self.mode)
             return self.file
         except FileNotFoundError:
-            logger.error(f"File not found: {self.filename}")
+            logger.error("File not found: %s", self.filename)
             raise
         except PermissionError:
-            logger.error(f"Permission denied: {self.filename}")
+            logger.error("Permission denied: %s", self.filename)
             raise
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.file:
             self.file.close()
-            logger.info(f"Closed file: {self.filename}")
+            logger.info("Closed file: %s", self.filename)
         
         # Handle exceptions
         if exc_type is not None:
-            logger.error(f"File operation failed: {exc_val}")
+            logger.error("File operation failed: %s", exc_val)
         
         return False  # Don't suppress exceptions
 
 class Timer:
     """
     A timer context manager with detailed timing information.
+    
+    start_time and end_time are perf_counter_ns() readings; elapsed_time is in seconds.
     """
     
+    __slots__ = ('name', 'start_time', 'end_time', 'elapsed_time')
+    
     def __init__(self, name: str = "Timer"):
         self.name = name
         self.start_time = None
@@ -111,32 +135,57 @@ class Timer:
         self.elapsed_time = 0.0
     
     def __enter__(self):
-        self.start_time = time.time()
-        logger.info(f"{self.name} started")
+        logger.info("%s started", self.name)
+        # Read the clock last so logging isn't included in the measurement
+        self.start_time = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.time()
-        self.elapsed_time = self.end_time - self.start_time
-        logger.info(f"{self.name} completed in {self.elapsed_time:.4f} seconds")
+        self.end_time = time.perf_counter_ns()
+        self.elapsed_time = (self.end_time - self.start_time) * 1e-9
+        logger.info("%s completed in %.4f seconds", self.name, self.elapsed_time)
         return False
     
     def get_elapsed_time(self) -> float:
         """Get the elapsed time."""
         if self.start_time is None:
             return 0.0
-        current_time = time.time()
-        return current_time - self.start_time
+        return (time.perf_counter_ns() - self.start_time) * 1e-9
+
+@contextmanager
+def timer(name: str = "Timer"):
+    """
+    Lightweight generator form of Timer.
+    
+    Enter and exit are fused into one generator, so no Timer instance is
+    created or updated. Prefer this when wrapping many short operations.
+    
+    Args:
+        name: Label used in the log messages
+        
+    Yields:
+        Callable returning the seconds elapsed so far
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield lambda: (time.perf_counter_ns() - start) * 1e-9
+    finally:
+        logger.info("%s completed in %.4f seconds", name, (time.perf_counter_ns() - start) * 1e-9)
 
 class TransactionManager:
     """
     A transaction context manager with rollback capabilities.
     """
     
-    def __init__(self, auto_commit: bool = True):
+    __slots__ = ('operations', 'committed', 'auto_commit', 'log_path')
+    
+    def __init__(self, auto_commit: bool = True, log_path: Optional[str] = None):
         self.operations = []
         self.committed = False
         self.auto_commit = auto_commit
+        # Optional write-ahead log: operations stay in memory until commit, which
+        # appends them all (one per line) with a single write and fsync
+        self.log_path = log_path
     
     def __enter__(self):
         self.operations = []
@@ -152,102 +201,124 @@ class TransactionManager:
         else:
             # Exception occurred, rollback
             self.rollback()
-            logger.error(f"Transaction rolled back due to: {exc_val}")
+            logger.error("Transaction rolled back due to: %s", exc_val)
         
         return False  # Don't suppress exceptions
     
     def add_operation(self, operation: str):
         """Add an operation to the transaction."""
         self.operations.append(operation)
-        logger.info(f"Added operation: {operation}")
+        # Called once per operation, so skip the logging call entirely when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Added operation: %s", operation)
     
     def commit(self):
         """Commit the transaction."""
-        logger.info(f"Committing {len(self.operations)} operations")
+        logger.info("Committing %d operations", len(self.operations))
+        if self.log_path is not None and self.operations:
+            record = "".join(f"{operation}\n" for operation in self.operations).encode('utf-8')
+            fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                _write_all(fd, record)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
         self.committed = True
     
     def rollback(self):
-        """Rollback the transaction."""
-        logger.info(f"Rolling back {len(self.operations)} operations")
+        """Rollback the transaction. Nothing was written yet, so there is nothing to undo on disk."""
+        logger.info("Rolling back %d operations", len(self.operations))
         self.committed = False
 
 class ResourcePool:
     """
     A thread-safe resource pool context manager.
+    
+    Idle resources live in a deque whose single-ended append/pop are atomic,
+    so reuse and release don't take the lock; only creating a new resource
+    does. resource_counter counts every resource created and caps the pool;
+    no per-resource bookkeeping is kept, so resources need not be hashable.
     """
     
+    __slots__ = ('max_size', 'resource_factory', 'available_resources', 'lock', 'resource_counter')
+    
     def __init__(self, max_size: int = 5, resource_factory=None):
         self.max_size = max_size
-        self.resource_factory = resource_factory or (lambda: f"Resource_{int(time.time())}")
-        self.available_resources = []
-        self.used_resources = set()
+        resource_ids = itertools.count(1)
+        self.resource_factory = resource_factory or (lambda: f"Resource_{next(resource_ids)}")
+        self.available_resources = deque()
         self.lock = threading.Lock()
         self.resource_counter = 0
     
+    @property
+    def in_use(self) -> int:
+        """Number of resources currently handed out."""
+        return self.resource_counter - len(self.available_resources)
+    
+    @contextmanager
     def get_resource(self):
-        """Get a resource from the pool."""
-        return ResourceContext(self)
+        """Get a resource from the pool for the duration of a with block."""
+        resource = self._acquire_resource()
+        try:
+            yield resource
+        finally:
+            self._release_resource(resource)
     
     def _acquire_resource(self):
         """Acquire a resource from the pool."""
-        with self.lock:
-            if self.available_resources:
-                resource = self.available_resources.pop()
-            else:
-                if len(self.used_resources) >= self.max_size:
-                    raise RuntimeError("No resources available")
-                self.resource_counter += 1
-                resource = self.resource_factory()
-            
-            self.used_resources.add(resource)
-            logger.info(f"Acquired resource: {resource}")
-            return resource
+        # Fast path: reuse an idle resource without locking (deque.pop is atomic)
+        try:
+            resource = self.available_resources.pop()
+        except IndexError:
+            # Slow path: only growing the pool needs the capacity check under the lock
+            with self.lock:
+                try:
+                    resource = self.available_resources.pop()
+                except IndexError:
+                    if self.resource_counter >= self.max_size:
+                        raise RuntimeError("No resources available") from None
+                    self.resource_counter += 1
+                    resource = self.resource_factory()
+        
+        logger.info("Acquired resource: %s", resource)
+        return resource
     
     def _release_resource(self, resource):
         """Release a resource back to the pool."""
-        with self.lock:
-            if resource in self.used_resources:
-                self.used_resources.remove(resource)
-                self.available_resources.append(resource)
-                logger.info(f"Released resource: {resource}")
-
-class ResourceContext:
-    """
-    Context manager for individual resources.
-    """
-    
-    def __init__(self, pool: ResourcePool):
-        self.pool = pool
-        self.resource = None
-    
-    def __enter__(self):
-        self.resource = self.pool._acquire_resource()
-        return self.resource
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.resource:
-            self.pool._release_resource(self.resource)
-        return False
+        # Only get_resource releases, and it always hands back what it acquired
+        self.available_resources.append(resource)
+        logger.info("Released resource: %s", resource)
 
 @contextmanager
-def multiple_files(*filenames):
+def multiple_files(*filenames, max_workers: int = 1):
     """
     Context manager for multiple files.
     
     Args:
         *filenames: File paths to open
+        max_workers: Threads used to open the files. Opening in parallel
+            overlaps round trips on high-latency filesystems (NFS, remote
+            mounts); on a local disk the default sequential open is faster.
         
     Yields:
         List of file objects
     """
-    files = []
-    try:
-        for filename in filenames:
-            files.append(open(filename, 'r'))
+    # ExitStack closes whatever was opened, in reverse order, even if a later open fails
+    with ExitStack() as stack:
+        if max_workers > 1 and len(filenames) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(filenames))) as executor:
+                futures = [executor.submit(open, filename, 'r', buffering=READ_BUFFER_SIZE)
+                           for filename in filenames]
+            # ExitStack isn't thread-safe, so register the opened files here, then
+            # let result() re-raise the first failure (the stack closes the rest)
+            for future in futures:
+                if future.exception() is None:
+                    stack.enter_context(future.result())
+            files = [future.result() for future in futures]
+        else:
+            files = [stack.enter_context(open(filename, 'r', buffering=READ_BUFFER_SIZE))
+                     for filename in filenames]
         yield files
-    finally:
-        for file in files:
-            file.close()
 
 @contextmanager
 def temporary_file(content: str = ""):
@@ -260,14 +331,15 @@ def temporary_file(content: str = ""):
     Yields:
         str: Path to the temporary file
     """
-    import tempfile
-    import os
+    # mkstemp hands back a raw fd: write to it directly, no file object or buffered writer
+    fd, path = tempfile.mkstemp()
+    try:
+        _write_all(fd, content.encode('utf-8'))
+    finally:
+        os.close(fd)
     
-    temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False)
     try:
-        temp_file.write(content)
-        temp_file.close()
-        yield temp_file.name
+        yield path
     finally:
-        os.unlink(temp_file.name)
+        os.unlink(path)
 
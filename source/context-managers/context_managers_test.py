@@ -2,7 +2,7 @@ import pytest
 import tempfile
 import os
 from context_managers import (DatabaseConnection, FileManager, Timer, TransactionManager, 
-                            ResourcePool, multiple_files, temporary_file)
+                            ResourcePool, multiple_files, temporary_file, timer)
 from contextlib import ExitStack
 
 def test_database_connection():
@@ -33,6 +33,16 @@ def test_file_manager():
     # Cleanup
     os.unlink(temp_file_path)
 
+def test_file_manager_binary_mode():
+    with tempfile.NamedTemporaryFile(mode='wb', delete=False) as temp_file:
+        temp_file.write(b"\x00\xffbytes")
+        temp_file_path = temp_file.name
+    
+    with FileManager(temp_file_path, 'rb') as file:
+        assert file.read() == b"\x00\xffbytes"
+    
+    os.unlink(temp_file_path)
+
 def test_timer_context_manager():
     with Timer() as timer:
         import time
@@ -41,6 +51,14 @@ def test_timer_context_manager():
     assert timer.elapsed_time > 0
     assert timer.elapsed_time < 1.0
 
+def test_timer_generator():
+    with timer("block") as elapsed:
+        import time
+        time.sleep(0.01)
+        assert elapsed() > 0
+    
+    assert elapsed() < 1.0
+
 def test_transaction_manager():
     with TransactionManager() as tx:
         tx.add_operation("INSERT INTO users VALUES (1, 'John')")
@@ -59,6 +77,22 @@ def test_transaction_manager_rollback():
     # Transaction should be rolled back
     assert tx.committed == False
 
+def test_transaction_manager_write_ahead_log(tmp_path):
+    log_path = tmp_path / "tx.log"
+    
+    with TransactionManager(log_path=str(log_path)) as tx:
+        tx.add_operation("INSERT INTO users VALUES (1, 'John')")
+        tx.add_operation("DELETE FROM users WHERE id = 2")
+        assert not log_path.exists()
+    
+    with pytest.raises(ValueError):
+        with TransactionManager(log_path=str(log_path)) as tx:
+            tx.add_operation("DROP TABLE users")
+            raise ValueError("Simulated error")
+    
+    assert log_path.read_text() == ("INSERT INTO users VALUES (1, 'John')\n"
+                                    "DELETE FROM users WHERE id = 2\n")
+
 def test_resource_pool():
     pool = ResourcePool(max_size=2)
     
@@ -67,9 +101,11 @@ def test_resource_pool():
         with pool.get_resource() as resource2:
             assert resource2 is not None
             assert resource1 != resource2
+            assert pool.in_use == 2
     
     # Resources should be returned to pool
     assert len(pool.available_resources) == 2
+    assert pool.in_use == 0
 
 def test_resource_pool_exhausted():
     pool = ResourcePool(max_size=1)
@@ -114,6 +150,25 @@ def test_multiple_files():
         os.unlink(f1_path)
         os.unlink(f2_path)
 
+def test_multiple_files_parallel_open():
+    paths = []
+    for i in range(3):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            f.write(f"File {i} content")
+            paths.append(f.name)
+    
+    try:
+        with multiple_files(*paths, max_workers=3) as files:
+            assert [f.read() for f in files] == ["File 0 content", "File 1 content", "File 2 content"]
+        assert all(f.closed for f in files)
+        
+        with pytest.raises(FileNotFoundError):
+            with multiple_files(paths[0], "missing.txt", max_workers=2):
+                pass
+    finally:
+        for path in paths:
+            os.unlink(path)
+
 def test_temporary_file():
     with temporary_file("Hello, World!") as temp_path:
         with open(temp_path, 'r') as f:
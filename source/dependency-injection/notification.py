@@ -1,10 +1,17 @@
 from abc import ABC, abstractmethod
+from functools import cached_property, partial
 import logging
+import random
+import re
+import time
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library modules only create their logger; the application entry point configures handlers
 logger = logging.getLogger(__name__)
 
+# Recipient formats, compiled once at import
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_PHONE_RE = re.compile(r"\+\d{9,}")
+
 class Notifier(ABC):
     """
     Abstract base class for notification implementations.
@@ -46,11 +53,18 @@ class NotificationService:
         Initialize the notification service.
         
         Args:
-            notifier (Notifier): The notification implementation to use
-        """
-        if not isinstance(notifier, Notifier):
-            raise TypeError("Notifier must implement the Notifier interface")
+            notifier: Any object with a send(recipient, message) method;
+                validate_recipient is used when present
+        """
+        # Duck typing instead of an ABC isinstance check; the bound methods are
+        # looked up once here rather than on every notification
+        send = getattr(notifier, "send", None)
+        if not callable(send):
+            raise TypeError("Notifier must provide a send(recipient, message) method")
         self.notifier = notifier
+        self._send = send
+        self._validate = (getattr(notifier, "validate_recipient", None)
+                          or partial(Notifier.validate_recipient, notifier))
     
     def send_notification(self, recipient, message):
         """
@@ -63,8 +77,8 @@ class NotificationService:
         Returns:
             bool: True if successful, False otherwise
         """
-        if not self.notifier.validate_recipient(recipient):
-            logger.error(f"Invalid recipient: {recipient}")
+        if not self._validate(recipient):
+            logger.error("Invalid recipient: %s", recipient)
             return False
         
         if not message or not message.strip():
@@ -72,14 +86,14 @@ class NotificationService:
             return False
         
         try:
-            result = self.notifier.send(recipient, message)
+            result = self._send(recipient, message)
             if result:
-                logger.info(f"Notification sent successfully to {recipient}")
+                logger.info("Notification sent successfully to %s", recipient)
             else:
-                logger.error(f"Failed to send notification to {recipient}")
+                logger.error("Failed to send notification to %s", recipient)
             return result
         except Exception as e:
-            logger.error(f"Error sending notification: {e}")
+            logger.error("Error sending notification: %s", e)
             return False
     
     def send_batch_notifications(self, notifications):
@@ -92,11 +106,8 @@ class NotificationService:
         Returns:
             list: List of success/failure results
         """
-        results = []
-        for recipient, message in notifications:
-            result = self.send_notification(recipient, message)
-            results.append(result)
-        return results
+        send = self.send_notification
+        return [send(recipient, message) for recipient, message in notifications]
 
 class EmailNotifier(Notifier):
     """
@@ -128,9 +139,7 @@ class EmailNotifier(Notifier):
         Returns:
             bool: True if valid email format
         """
-        if not super().validate_recipient(recipient):
-            return False
-        return "@" in recipient and "." in recipient
+        return bool(recipient) and _EMAIL_RE.fullmatch(recipient) is not None
 
 class SMSNotifier(Notifier):
     """
@@ -162,9 +171,7 @@ class SMSNotifier(Notifier):
         Returns:
             bool: True if valid phone format
         """
-        if not super().validate_recipient(recipient):
-            return False
-        return recipient.startswith("+") and len(recipient) >= 10
+        return bool(recipient) and _PHONE_RE.fullmatch(recipient) is not None
 
 class PushNotifier(Notifier):
     """
@@ -196,22 +203,29 @@ class PushNotifier(Notifier):
         Returns:
             bool: True if valid device ID
         """
-        if not super().validate_recipient(recipient):
-            return False
-        return len(recipient) >= 5
+        return bool(recipient) and len(recipient) >= 5 and not recipient.isspace()
 
 class RetryNotifier(Notifier):
     """
     Notifier that retries failed notifications.
     """
     
-    def __init__(self, notifier, max_retries=3):
+    def __init__(self, notifier, max_retries=3, base_delay=0.1, max_delay=2.0):
         self.notifier = notifier
         self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._send = notifier.send
     
     def send(self, recipient, message):
-        for attempt in range(self.max_retries):
-            if self.notifier.send(recipient, message):
+        send = self._send
+        if send(recipient, message):
+            return True
+        
+        # Capped exponential backoff with full jitter, so failing callers don't retry in lockstep
+        for attempt in range(1, self.max_retries):
+            time.sleep(random.random() * min(self.max_delay, self.base_delay * (1 << (attempt - 1))))
+            if send(recipient, message):
                 return True
         return False
 
@@ -224,16 +238,34 @@ class LoggingNotifier(Notifier):
         self.notifier = notifier
     
     def send(self, recipient, message):
-        logger.info(f"Attempting to send notification to {recipient}")
+        logger.info("Attempting to send notification to %s", recipient)
         result = self.notifier.send(recipient, message)
-        logger.info(f"Notification result: {result}")
+        logger.info("Notification result: %s", result)
         return result
 
 class NotificationFactory:
     """
     Factory for creating notification services.
+    
+    The built-in notifiers are stateless, so each factory builds its email, SMS
+    and push services once and hands the same instance back on every call.
     """
     
+    @cached_property
+    def email_service(self):
+        """NotificationService backed by an EmailNotifier, built on first use."""
+        return NotificationService(EmailNotifier())
+    
+    @cached_property
+    def sms_service(self):
+        """NotificationService backed by an SMSNotifier, built on first use."""
+        return NotificationService(SMSNotifier())
+    
+    @cached_property
+    def push_service(self):
+        """NotificationService backed by a PushNotifier, built on first use."""
+        return NotificationService(PushNotifier())
+    
     def create_email_service(self):
         """
         Create an email notification service.
@@ -241,7 +273,7 @@ class NotificationFactory:
         Returns:
             NotificationService: Email notification service
         """
-        return NotificationService(EmailNotifier())
+        return self.email_service
     
     def create_sms_service(self):
         """
@@ -250,7 +282,7 @@ class NotificationFactory:
         Returns:
             NotificationService: SMS notification service
         """
-        return NotificationService(SMSNotifier())
+        return self.sms_service
     
     def create_push_service(self):
         """
@@ -259,7 +291,7 @@ class NotificationFactory:
         Returns:
             NotificationService: Push notification service
         """
-        return NotificationService(PushNotifier())
+        return self.push_service
     
     def create_service_with_retry(self, notifier, max_retries=3):
         """
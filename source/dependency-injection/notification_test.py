@@ -34,6 +34,17 @@ def test_notification_service_failure():
     result = service.send_notification("user@example.com", "Hello World")
     assert result == False
 
+def test_notification_service_rejects_object_without_send():
+    with pytest.raises(TypeError):
+        NotificationService(object())
+
+def test_recipient_validation():
+    assert EmailNotifier().validate_recipient("user@example.com") == True
+    assert EmailNotifier().validate_recipient("user@example") == False
+    assert SMSNotifier().validate_recipient("+1234567890") == True
+    assert SMSNotifier().validate_recipient("+12345abcde") == False
+    assert PushNotifier().validate_recipient("     ") == False
+
 def test_notification_service_batch():
     email_notifier = EmailNotifier()
     service = NotificationService(email_notifier)
@@ -57,6 +68,12 @@ def test_notification_factory():
     sms_service = factory.create_sms_service()
     assert isinstance(sms_service.notifier, SMSNotifier)
 
+def test_notification_factory_reuses_services():
+    factory = NotificationFactory()
+    
+    assert factory.create_email_service() is factory.create_email_service()
+    assert factory.create_push_service() is factory.create_push_service()
+
 def test_notification_service_with_retry():
     failing_notifier = FailingNotifier()
     retry_notifier = RetryNotifier(failing_notifier, max_retries=3)
@@ -65,6 +82,21 @@ def test_notification_service_with_retry():
     result = service.send_notification("user@example.com", "Hello World")
     assert result == True
 
+def test_retry_notifier_retries_until_success():
+    class FlakyNotifier:
+        def __init__(self):
+            self.attempts = 0
+        
+        def send(self, recipient, message):
+            self.attempts += 1
+            return self.attempts == 2
+    
+    flaky_notifier = FlakyNotifier()
+    retry_notifier = RetryNotifier(flaky_notifier, max_retries=3, base_delay=0)
+    
+    assert retry_notifier.send("user@example.com", "Hello World") == True
+    assert flaky_notifier.attempts == 2
+
 def test_notification_service_with_logging():
     email_notifier = EmailNotifier()
     logging_notifier = LoggingNotifier(email_notifier)
@@ -1,15 +1,58 @@
+import os
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Lower-case suffixes accepted by validate_file; a tuple so endswith checks them in one call
+ALLOWED_EXTENSIONS = ('.txt',)
+
+# Distinct file versions kept by read_file_cached
+READ_CACHE_SIZE = 128
+
 class InvalidFileTypeError(Exception):
     pass
 
 def read_file(filename):
     try:
-        with open(filename, 'r') as f:
-            return f.read()
+        return Path(filename).read_text()
     except FileNotFoundError:
         return None
 
+@lru_cache(maxsize=READ_CACHE_SIZE)
+def _read_file_version(filename, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key: a changed file gets a new entry
+    return Path(filename).read_text()
+
+def read_file_cached(filename):
+    """
+    Like read_file, but repeat reads of an unchanged file come from memory.
+    
+    One os.stat per call checks the modification time and size, so an edited
+    file is read again; the least recently used versions are evicted.
+    """
+    try:
+        st = os.stat(filename)
+        return _read_file_version(filename, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        return None
+
+def read_files(filenames, max_workers=None):
+    """
+    Read several files concurrently, returning their contents in input order.
+    
+    Each entry follows read_file: the text, or None if the file is missing.
+    Reads are I/O-bound and release the GIL, so threads overlap their latency.
+    """
+    filenames = list(filenames)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    if max_workers <= 1 or len(filenames) <= 1:
+        return [read_file(filename) for filename in filenames]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(filenames))) as executor:
+        return list(executor.map(read_file, filenames))
+
 def validate_file(filename):
-    if not filename.endswith('.txt'):
+    if not filename.lower().endswith(ALLOWED_EXTENSIONS):
         raise InvalidFileTypeError("Only .txt files are allowed")
 
 
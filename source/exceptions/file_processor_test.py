@@ -1,5 +1,5 @@
 import pytest
-from file_processor import read_file, InvalidFileTypeError
+from file_processor import read_file, read_file_cached, read_files, validate_file, InvalidFileTypeError
 
 def test_read_existing_file():
     # Create a test file first
@@ -13,10 +13,30 @@ def test_read_nonexistent_file():
     result = read_file("nonexistent.txt")
     assert result is None
 
+def test_read_files_keeps_order(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"file{i}.txt"
+        path.write_text(f"content {i}")
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.txt"))
+    
+    assert read_files(paths, max_workers=4) == [f"content {i}" for i in range(5)] + [None]
+
+def test_read_file_cached_sees_changes(tmp_path):
+    path = tmp_path / "cached.txt"
+    path.write_text("first")
+    
+    assert read_file_cached(str(path)) == "first"
+    assert read_file_cached(str(path)) == "first"
+    
+    path.write_text("second version")
+    assert read_file_cached(str(path)) == "second version"
+    assert read_file_cached(str(tmp_path / "missing.txt")) is None
+
 def test_validate_file_extension():
     with pytest.raises(InvalidFileTypeError):
         validate_file("document.pdf")
 
-
-
-
+def test_validate_file_extension_ignores_case():
+    validate_file("NOTES.TXT")
@@ -5,6 +5,7 @@ Learn Python with Tests - Functional Programming Concepts
 """
 
 import pytest
+from dataclasses import dataclass
 from functools import reduce
 from functional_programming import FunctionalProgramming
 
@@ -77,6 +78,20 @@ class TestFunctionComposition:
         composed = fp.compose_multiple(functions)
         result = composed(5)
         assert result == 9  # ((5 + 1) * 2) - 3
+    
+    def test_pipe_unhashable_callable(self):
+        """Should compose callables that cannot be hashed."""
+        @dataclass
+        class Scale:
+            factor: int
+            
+            def __call__(self, x):
+                return x * self.factor
+        
+        fp = FunctionalProgramming()
+        assert fp.pipe(Scale(3), Scale(2))(5) == 30
+        assert fp.compose(Scale(3), lambda x: x + 1)(1) == 6
+        assert fp.compose_multiple([Scale(2)])(4) == 8
 
 
 class TestCurrying:
@@ -227,6 +242,13 @@ class TestMemoization:
         result2 = fp.memoized_fibonacci(30)
         assert result2 == 832040
     
+    def test_memoized_fibonacci_negative(self):
+        """Should agree with pure_fibonacci for negative n once the cache has grown."""
+        fp = FunctionalProgramming()
+        
+        fp.memoized_fibonacci(10)
+        assert fp.memoized_fibonacci(-1) == fp.pure_fibonacci(-1) == 0
+    
     def test_custom_memoize(self):
         """Should create custom memoization decorator."""
         fp = FunctionalProgramming()
@@ -16,16 +16,70 @@ def fibonacci_generator(n: Optional[int] = None) -> Iterator[int]:
         raise ValueError("n must be non-negative")
     
     a, b = 0, 1
-    count = 0
-    
-    while n is None or count < n:
+    # Pick the loop shape once instead of re-testing n on every value
+    if n is None:
+        while True:
+            yield a
+            a, b = b, a + b
+    for _ in range(n):
         yield a
         a, b = b, a + b
-        count += 1
+
+def fibonacci_nth(n: int) -> int:
+    """
+    Calculate the nth Fibonacci number by fast doubling.
+    
+    Uses F(2k) = F(k)(2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2,
+    so F(n) takes O(log n) big-int multiplications instead of n additions.
+    
+    Args:
+        n (int): Index of the Fibonacci number (F(0) == 0)
+        
+    Returns:
+        int: The nth Fibonacci number
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    
+    a, b = 0, 1  # F(k), F(k+1), starting from k = 0
+    for shift in range(n.bit_length() - 1, -1, -1):
+        # Double k, then add the next bit of n
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if (n >> shift) & 1:
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+# Sieve segment length: 256 KiB of flags keeps each segment's stride writes in L2 cache
+SIEVE_SEGMENT_SIZE = 256 * 1024
+
+def _nth_prime_upper_bound(n: int) -> int:
+    """Upper bound on the nth prime: p_n < n(ln n + ln ln n) for n >= 6."""
+    if n < 6:
+        return 13
+    return int(n * (math.log(n) + math.log(math.log(n)))) + 1
+
+def _sieve(limit: int) -> bytearray:
+    """Plain Sieve of Eratosthenes: flags[i] is 1 when i <= limit is prime."""
+    flags = bytearray([1]) * (limit + 1)
+    flags[::2] = bytes(len(range(0, limit + 1, 2)))
+    flags[1:3] = b"\x00\x01"[:limit]
+    for p in range(3, math.isqrt(limit) + 1, 2):
+        if flags[p]:
+            # Slice assignment crosses off multiples in one C-level loop; even
+            # multiples are already gone, so step 2p over the odd ones only
+            flags[p * p::2 * p] = bytes(len(range(p * p, limit + 1, 2 * p)))
+    return flags
 
 def prime_generator(n: int) -> Iterator[int]:
     """
-    Generate prime numbers using Sieve of Eratosthenes.
+    Generate prime numbers using a segmented Sieve of Eratosthenes.
+    
+    The range up to the nth prime's upper bound is sieved one segment at a
+    time, so primes are yielded as each segment completes and memory stays
+    at one segment regardless of n.
     
     Args:
         n (int): Number of primes to generate
@@ -36,25 +90,32 @@ def prime_generator(n: int) -> Iterator[int]:
     if n <= 0:
         return
     
-    def is_prime(num):
-        if num < 2:
-            return False
-        if num == 2:
-            return True
-        if num % 2 == 0:
-            return False
-        for i in range(3, int(math.sqrt(num)) + 1, 2):
-            if num % i == 0:
-                return False
-        return True
-    
-    count = 0
-    num = 2
-    while count < n:
-        if is_prime(num):
-            yield num
-            count += 1
-        num += 1
+    upper = _nth_prime_upper_bound(n)
+    root = math.isqrt(upper)
+    odd_base_primes = list(itertools.compress(range(root + 1), _sieve(root)))[1:]
+    
+    remaining = n
+    for low in range(0, upper + 1, SIEVE_SEGMENT_SIZE):
+        high = min(low + SIEVE_SEGMENT_SIZE, upper + 1)
+        segment = bytearray([1]) * (high - low)
+        # Cross off the even numbers in one pass, then restore 2 itself
+        segment[low & 1::2] = bytes(len(range(low & 1, high - low, 2)))
+        if low == 0:
+            segment[1:3] = b"\x00\x01"
+        for p in odd_base_primes:
+            if p * p >= high:
+                break
+            # First odd multiple of p in this segment that a smaller prime hasn't covered
+            start = max(p * p, -(-low // p) * p)
+            if not start & 1:
+                start += p
+            start -= low
+            segment[start::2 * p] = bytes(len(range(start, high - low, 2 * p)))
+        for prime in itertools.compress(range(low, high), segment):
+            yield prime
+            remaining -= 1
+            if remaining == 0:
+                return
 
 class DataProcessor:
     """
@@ -74,8 +135,9 @@ class DataProcessor:
         Returns:
             DataProcessor: New processor with filtered data
         """
-        filtered_data = (item for item in self.data if predicate(item))
-        return DataProcessor(filtered_data)
+        # Builtin filter/map/islice are C iterators: a chained pipeline adds no
+        # Python generator frames between the source and the callbacks
+        return DataProcessor(filter(predicate, self.data))
     
     def map(self, func: Callable) -> 'DataProcessor':
         """
@@ -87,8 +149,7 @@ class DataProcessor:
         Returns:
             DataProcessor: New processor with mapped data
         """
-        mapped_data = (func(item) for item in self.data)
-        return DataProcessor(mapped_data)
+        return DataProcessor(map(func, self.data))
     
     def take(self, n: int) -> 'DataProcessor':
         """
@@ -100,8 +161,7 @@ class DataProcessor:
         Returns:
             DataProcessor: New processor with limited data
         """
-        limited_data = itertools.islice(self.data, n)
-        return DataProcessor(limited_data)
+        return DataProcessor(itertools.islice(self.data, n))
     
     def skip(self, n: int) -> 'DataProcessor':
         """
@@ -113,8 +173,7 @@ class DataProcessor:
         Returns:
             DataProcessor: New processor with skipped data
         """
-        skipped_data = itertools.islice(self.data, n, None)
-        return DataProcessor(skipped_data)
+        return DataProcessor(itertools.islice(self.data, n, None))
     
     def __iter__(self):
         return iter(self.data)
@@ -151,58 +210,90 @@ def custom_range(start: int, stop: int, step: int = 1) -> Iterator[int]:
         yield current
         current += step
 
-def batch_processor(data: List[Any], batch_size: int) -> Iterator[List[Any]]:
+def _zero_copy(data):
+    """Wrap buffer-protocol data (bytes, bytearray, array.array) in a memoryview.
+    
+    Slicing a memoryview returns a view onto the same memory rather than a
+    copy. Other sequences such as lists are returned unchanged.
+    """
+    try:
+        return memoryview(data)
+    except TypeError:
+        return data
+
+def batch_processor(data: List[Any], batch_size: int, views: bool = False) -> Iterator[List[Any]]:
     """
     Process data in batches.
     
     Args:
         data: Data to process
         batch_size: Size of each batch
+        views: For bytes/bytearray/array input, yield memoryview slices
+            instead of copies. Views share memory with data: later writes to
+            data show up in batches already yielded, and resizing a bytearray
+            while a view is alive raises BufferError. Views also lack
+            .decode(), hashing and equality with bytes literals.
         
     Yields:
-        List: Batches of data
+        List: Batches of data, sliced like data (memoryviews when views=True)
     """
     if batch_size <= 0:
         raise ValueError("batch_size must be positive")
     
+    if views:
+        data = _zero_copy(data)
     for i in range(0, len(data), batch_size):
         yield data[i:i + batch_size]
 
-def sliding_window(data: List[Any], window_size: int) -> Iterator[List[Any]]:
+def sliding_window(data: List[Any], window_size: int, views: bool = False) -> Iterator[List[Any]]:
     """
     Create sliding windows over data.
     
     Args:
         data: Data to create windows from
         window_size: Size of each window
+        views: As for batch_processor: memoryview windows over
+            bytes/bytearray/array input, aliasing data instead of copying it
         
     Yields:
-        List: Windows of data
+        List: Windows of data, sliced like data (memoryviews when views=True)
     """
     if window_size <= 0:
         raise ValueError("window_size must be positive")
     
+    if views:
+        data = _zero_copy(data)
     for i in range(len(data) - window_size + 1):
         yield data[i:i + window_size]
 
+try:
+    # Python 3.10+: pairs are built in C
+    _pairwise = itertools.pairwise
+except AttributeError:
+    def _pairwise(iterable):
+        first, second = itertools.tee(iterable)
+        next(second, None)
+        return zip(first, second)
+
 def pairwise(data: List[Any]) -> Iterator[tuple]:
     """
     Create pairs of adjacent elements.
     
     Args:
-        data: Data to create pairs from
+        data: Data to create pairs from (any iterable)
         
     Yields:
         tuple: Pairs of adjacent elements
     """
-    for i in range(len(data) - 1):
-        yield (data[i], data[i + 1])
+    return _pairwise(data)
 
 class NumberIterator:
     """
     Custom iterator for numbers.
     """
     
+    __slots__ = ('start', 'end', 'step', 'current')
+    
     def __init__(self, start: int, end: int, step: int = 1):
         self.start = start
         self.end = end
@@ -213,10 +304,12 @@ class NumberIterator:
         return self
     
     def __next__(self):
-        if (self.step > 0 and self.current >= self.end) or (self.step < 0 and self.current <= self.end):
-            raise StopIteration
+        # Read each attribute once into a local; __next__ runs once per value
         value = self.current
-        self.current += self.step
+        step = self.step
+        if (value >= self.end) if step > 0 else (value <= self.end):
+            raise StopIteration
+        self.current = value + step
         return value
 
 def infinite_counter(start: int = 0, step: int = 1) -> Iterator[int]:
@@ -1,5 +1,6 @@
 import pytest
-from generators import (fibonacci_generator, prime_generator, data_processor, custom_range, 
+from array import array
+from generators import (fibonacci_generator, fibonacci_nth, prime_generator, data_processor, custom_range, 
                        batch_processor, sliding_window, pairwise, NumberIterator, 
                        infinite_counter, cycle_generator)
 
@@ -17,11 +18,20 @@ def test_fibonacci_generator_negative():
     with pytest.raises(ValueError):
         list(fibonacci_generator(-1))
 
+def test_fibonacci_nth():
+    assert [fibonacci_nth(i) for i in range(20)] == list(fibonacci_generator(20))
+    assert fibonacci_nth(300) == list(fibonacci_generator(301))[-1]
+
 def test_prime_generator():
     primes = prime_generator(10)
     prime_list = list(primes)
     assert prime_list == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
 
+def test_prime_generator_many():
+    primes = list(prime_generator(1000))
+    assert len(primes) == 1000
+    assert primes[-1] == 7919
+
 def test_prime_generator_zero():
     primes = prime_generator(0)
     assert list(primes) == []
@@ -76,6 +86,33 @@ def test_sliding_window():
     
     assert window_list == [[1, 2, 3], [2, 3, 4], [3, 4, 5]]
 
+def test_sliding_window_copies_by_default():
+    data = bytearray(b"abcde")
+    windows = list(sliding_window(data, 3))
+    
+    assert windows[0] == b"abc"
+    data[2] = ord("X")  # default slices are copies
+    assert windows[0] == b"abc"
+    assert list(batch_processor(b"hello", 2)) == [b"he", b"ll", b"o"]
+
+def test_sliding_window_buffer_views():
+    data = array('i', [1, 2, 3, 4, 5])
+    windows = list(sliding_window(data, 3, views=True))
+    
+    assert [w.tolist() for w in windows] == [[1, 2, 3], [2, 3, 4], [3, 4, 5]]
+    data[2] = 30  # windows are views, not copies
+    assert windows[0].tolist() == [1, 2, 30]
+    assert [b.tolist() for b in batch_processor(data, 2, views=True)] == [[1, 2], [30, 4], [5]]
+
+def test_batch_processor_views_pin_bytearray():
+    data = bytearray(b"abcd")
+    batch = next(batch_processor(data, 2, views=True))
+    
+    with pytest.raises(BufferError):
+        data.extend(b"ef")
+    batch.release()
+    data.extend(b"ef")
+
 def test_sliding_window_invalid_size():
     with pytest.raises(ValueError):
         list(sliding_window([1, 2, 3], 0))
@@ -87,6 +124,10 @@ def test_pairwise():
     
     assert pair_list == [(1, 2), (2, 3), (3, 4), (4, 5)]
 
+def test_pairwise_iterator():
+    pairs = pairwise(x * 10 for x in range(4))
+    assert list(pairs) == [(0, 10), (10, 20), (20, 30)]
+
 def test_custom_iterator():
     iterator = NumberIterator(1, 5)
     assert list(iterator) == [1, 2, 3, 4]
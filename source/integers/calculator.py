@@ -62,17 +62,22 @@ class Calculator:
             raise ValueError("Cannot divide by zero")
         return a / b
     
-    def power(self, base, exponent):
+    def power(self, base, exponent, modulus=None):
         """
         Raise base to the power of exponent.
         
         Args:
             base (int): The base number
             exponent (int): The exponent
+            modulus (int, optional): Reduce the result modulo this number
             
         Returns:
             float: base raised to the power of exponent
         """
+        if modulus is not None:
+            # Three-argument pow reduces at every squaring step, so the full
+            # base ** exponent is never built
+            return pow(base, exponent, modulus)
         return base ** exponent
     
     def square_root(self, number):
@@ -31,6 +31,11 @@ def test_power():
     result = calc.power(2, 3)
     assert result == 8
 
+def test_power_with_modulus():
+    calc = Calculator()
+    result = calc.power(3, 10**6, 1000)
+    assert result == pow(3, 10**6) % 1000
+
 def test_square_root():
     calc = Calculator()
     result = calc.square_root(9)
@@ -1,3 +1,5 @@
+from collections import Counter
+
 def sum_numbers(numbers):
     """
     Sum all numbers in a list.
@@ -8,6 +10,8 @@ def sum_numbers(numbers):
     Returns:
         int: Sum of all numbers
     """
+    # sum() and max() below already reduce in C (sum has int/float fast paths), so
+    # there is no per-element bytecode left to remove without a NumPy dependency
     return sum(numbers)
 
 def find_max(numbers):
@@ -41,16 +45,34 @@ def count_occurrences(numbers, target):
     """
     return numbers.count(target)
 
+def count_occurrences_batch(numbers, targets):
+    """
+    Count how many times each of several targets appears in a list.
+    
+    Args:
+        numbers (list): List of numbers to search
+        targets (list): Numbers to count
+        
+    Returns:
+        list: Number of occurrences of each target, in the order given
+    """
+    # One O(n) pass builds every count; each target is then an O(1) lookup,
+    # where calling count_occurrences per target would rescan the list each time
+    counts = Counter(numbers)
+    return [counts[target] for target in targets]
+
 def reverse_list(numbers):
     """
     Reverse a list of numbers.
     
     Args:
-        numbers (list): List to reverse
+        numbers (list): List (or array.array) to reverse
         
     Returns:
         list: Reversed list
     """
+    # A reversed slice is one C loop copying pointers. Packed array.array input
+    # works too and stays packed, so no int is boxed or unboxed.
     return numbers[::-1]
 
 def filter_even_numbers(numbers):
@@ -75,7 +97,8 @@ def map_square(numbers):
     Returns:
         list: List of squared numbers
     """
-    return [num ** 2 for num in numbers]
+    # num * num is a plain multiply; num ** 2 goes through the generic pow path
+    return [num * num for num in numbers]
 
 def find_duplicates(numbers):
     """
@@ -108,13 +131,14 @@ def group_by_parity(numbers):
     Returns:
         dict: Dictionary with 'odd' and 'even' keys
     """
-    result = {'odd': [], 'even': []}
+    even, odd = [], []
+    # Bind the appends once; % 2 (not & 1) so floats such as 2.0 still group
+    append_even, append_odd = even.append, odd.append
     
     for num in numbers:
         if num % 2 == 0:
-            result['even'].append(num)
+            append_even(num)
         else:
-            result['odd'].append(num)
+            append_odd(num)
     
-    return result
-
+    return {'odd': odd, 'even': even}
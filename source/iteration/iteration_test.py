@@ -1,5 +1,6 @@
 import pytest
-from iteration import (sum_numbers, find_max, count_occurrences, reverse_list,
+from array import array
+from iteration import (sum_numbers, find_max, count_occurrences, count_occurrences_batch, reverse_list,
                       filter_even_numbers, map_square, find_duplicates, group_by_parity)
 
 def test_sum_numbers():
@@ -25,16 +26,28 @@ def test_count_occurrences():
     result = count_occurrences(numbers, 2)
     assert result == 3
 
+def test_count_occurrences_batch():
+    numbers = [1, 2, 2, 3, 2, 4]
+    result = count_occurrences_batch(numbers, [2, 4, 7])
+    assert result == [3, 1, 0]
+
 def test_reverse_list():
     numbers = [1, 2, 3, 4, 5]
     result = reverse_list(numbers)
     assert result == [5, 4, 3, 2, 1]
 
+def test_reverse_packed_array():
+    numbers = array('q', [1, 2, 3])
+    assert reverse_list(numbers) == array('q', [3, 2, 1])
+
 def test_filter_even_numbers():
     numbers = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
     result = filter_even_numbers(numbers)
     assert result == [2, 4, 6, 8, 10]
 
+def test_filter_even_numbers_floats():
+    assert filter_even_numbers([1.0, 2.0, 3.5, 4.0]) == [2.0, 4.0]
+
 def test_map_square():
     numbers = [1, 2, 3, 4, 5]
     result = map_square(numbers)
@@ -50,3 +63,6 @@ def test_group_by_parity():
     result = group_by_parity(numbers)
     assert result == {'odd': [1, 3, 5], 'even': [2, 4, 6]}
 
+def test_group_by_parity_floats():
+    assert group_by_parity([2.0, 3.0]) == {'odd': [3.0], 'even': [2.0]}
+
@@ -1,5 +1,8 @@
 import math
-from typing import List, Union, Any, Iterator
+from math import gcd
+from array import array
+from operator import add, sub, mul
+from typing import List, Union, Any, Iterator, Iterable
 from functools import total_ordering
 
 class Vector:
@@ -7,11 +10,22 @@ class Vector:
     A 3D vector class with comprehensive magic methods.
     """
     
+    __slots__ = ('x', 'y', 'z')
+    
     def __init__(self, x: float = 0, y: float = 0, z: float = 0):
         self.x = float(x)
         self.y = float(y)
         self.z = float(z)
     
+    @classmethod
+    def _from_floats(cls, x: float, y: float, z: float) -> 'Vector':
+        """Build a Vector from components that are already floats, skipping float() coercion."""
+        vector = cls.__new__(cls)
+        vector.x = x
+        vector.y = y
+        vector.z = z
+        return vector
+    
     def __str__(self):
         return f"Vector({self.x}, {self.y}, {self.z})"
     
@@ -21,17 +35,17 @@ class Vector:
     def __add__(self, other):
         if not isinstance(other, Vector):
             raise TypeError("Can only add Vector to Vector")
-        return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+        return Vector._from_floats(self.x + other.x, self.y + other.y, self.z + other.z)
     
     def __sub__(self, other):
         if not isinstance(other, Vector):
             raise TypeError("Can only subtract Vector from Vector")
-        return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+        return Vector._from_floats(self.x - other.x, self.y - other.y, self.z - other.z)
     
     def __mul__(self, scalar):
         if not isinstance(scalar, (int, float)):
             raise TypeError("Can only multiply Vector by scalar")
-        return Vector(self.x * scalar, self.y * scalar, self.z * scalar)
+        return Vector._from_floats(self.x * scalar, self.y * scalar, self.z * scalar)
     
     def __rmul__(self, scalar):
         return self.__mul__(scalar)
@@ -41,7 +55,7 @@ class Vector:
             raise TypeError("Can only divide Vector by scalar")
         if scalar == 0:
             raise ValueError("Cannot divide Vector by zero")
-        return Vector(self.x / scalar, self.y / scalar, self.z / scalar)
+        return Vector._from_floats(self.x / scalar, self.y / scalar, self.z / scalar)
     
     def __eq__(self, other):
         if not isinstance(other, Vector):
@@ -55,7 +69,8 @@ class Vector:
         return 3
     
     def __abs__(self):
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        # One C call; hypot also avoids overflow/underflow in the intermediate squares
+        return math.hypot(self.x, self.y, self.z)
     
     def __getitem__(self, index):
         if index == 0:
@@ -69,11 +84,11 @@ class Vector:
     
     def __setitem__(self, index, value):
         if index == 0:
-            self.x = value
+            self.x = float(value)
         elif index == 1:
-            self.y = value
+            self.y = float(value)
         elif index == 2:
-            self.z = value
+            self.z = float(value)
         else:
             raise IndexError("Vector index out of range")
     
@@ -86,10 +101,10 @@ class Vector:
         return self.x != 0 or self.y != 0 or self.z != 0
     
     def __neg__(self):
-        return Vector(-self.x, -self.y, -self.z)
+        return Vector._from_floats(-self.x, -self.y, -self.z)
     
     def __pos__(self):
-        return Vector(self.x, self.y, self.z)
+        return Vector._from_floats(self.x, self.y, self.z)
     
     def dot(self, other):
         """Calculate dot product with another vector."""
@@ -101,17 +116,105 @@ class Vector:
         """Calculate cross product with another vector."""
         if not isinstance(other, Vector):
             raise TypeError("Can only calculate cross product with Vector")
-        return Vector(
+        return Vector._from_floats(
             self.y * other.z - self.z * other.y,
             self.z * other.x - self.x * other.z,
             self.x * other.y - self.y * other.x
         )
 
+class VectorArray:
+    """
+    Many 3D vectors stored column-wise (structure of arrays).
+    
+    x, y and z are packed array('d') columns, so N vectors cost three
+    buffers of 8-byte doubles instead of N Vector objects. Arithmetic runs
+    element-wise through map() over C operator functions, with no Python
+    bytecode per element.
+    """
+    
+    __slots__ = ('x', 'y', 'z')
+    
+    def __init__(self, xs: Iterable[float] = (), ys: Iterable[float] = (), zs: Iterable[float] = ()):
+        self.x = array('d', xs)
+        self.y = array('d', ys)
+        self.z = array('d', zs)
+        if not len(self.x) == len(self.y) == len(self.z):
+            raise ValueError("All coordinate columns must have the same length")
+    
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector]) -> 'VectorArray':
+        """Pack Vector objects into columns."""
+        result = cls()
+        for v in vectors:
+            result.x.append(v.x)
+            result.y.append(v.y)
+            result.z.append(v.z)
+        return result
+    
+    def __repr__(self):
+        return f"VectorArray({len(self)} vectors)"
+    
+    def __len__(self):
+        return len(self.x)
+    
+    def __getitem__(self, index):
+        return Vector(self.x[index], self.y[index], self.z[index])
+    
+    def __iter__(self):
+        return map(Vector, self.x, self.y, self.z)
+    
+    def _check(self, other):
+        if not isinstance(other, VectorArray):
+            raise TypeError("Operand must be a VectorArray")
+        if len(other) != len(self):
+            raise ValueError("VectorArrays must have the same length")
+    
+    def __add__(self, other):
+        self._check(other)
+        return VectorArray(map(add, self.x, other.x), map(add, self.y, other.y), map(add, self.z, other.z))
+    
+    def __sub__(self, other):
+        self._check(other)
+        return VectorArray(map(sub, self.x, other.x), map(sub, self.y, other.y), map(sub, self.z, other.z))
+    
+    def __mul__(self, scalar):
+        if not isinstance(scalar, (int, float)):
+            raise TypeError("Can only multiply VectorArray by scalar")
+        scale = float(scalar).__mul__
+        return VectorArray(map(scale, self.x), map(scale, self.y), map(scale, self.z))
+    
+    def __rmul__(self, scalar):
+        return self.__mul__(scalar)
+    
+    def __abs__(self):
+        """Magnitude of every vector."""
+        return array('d', map(math.hypot, self.x, self.y, self.z))
+    
+    def dot(self, other) -> array:
+        """Pairwise dot products."""
+        self._check(other)
+        return array('d', [ax * bx + ay * by + az * bz for ax, ay, az, bx, by, bz
+                           in zip(self.x, self.y, self.z, other.x, other.y, other.z)])
+    
+    def cross(self, other) -> 'VectorArray':
+        """Pairwise cross products."""
+        self._check(other)
+        return VectorArray(
+            map(sub, map(mul, self.y, other.z), map(mul, self.z, other.y)),
+            map(sub, map(mul, self.z, other.x), map(mul, self.x, other.z)),
+            map(sub, map(mul, self.x, other.y), map(mul, self.y, other.x))
+        )
+
 class Matrix:
     """
     A matrix class with comprehensive magic methods.
     """
     
+    __slots__ = ('data', 'rows', 'cols')
+    
+    # Columns of the right operand processed together by __mul__
+    MUL_BLOCK_COLUMNS = 16
+    
     def __init__(self, data: List[List[float]]):
         if not data:
             raise ValueError("Matrix cannot be empty")
@@ -152,15 +255,17 @@ class Matrix:
         if self.cols != other.rows:
             raise ValueError("Matrix dimensions incompatible for multiplication")
         
-        result = []
-        for i in range(self.rows):
-            row = []
-            for j in range(other.cols):
-                sum_val = 0
-                for k in range(self.cols):
-                    sum_val += self.data[i][k] * other.data[k][j]
-                row.append(sum_val)
-            result.append(row)
+        # Transpose once so each output element is a C-level dot product of two
+        # rows: sum() over map(mul, ...) runs the k loop without bytecode per step
+        columns = list(zip(*other.data))
+        result = [[] for _ in range(self.rows)]
+        # Tile over columns: one block of columns is reused against every row
+        # while it is still cache-resident, instead of streaming all of other per row
+        block_size = self.MUL_BLOCK_COLUMNS
+        for start in range(0, other.cols, block_size):
+            block = columns[start:start + block_size]
+            for row, result_row in zip(self.data, result):
+                result_row.extend([sum(map(mul, row, column)) for column in block])
         
         return Matrix(result)
     
@@ -171,12 +276,8 @@ class Matrix:
         if self.rows != other.rows or self.cols != other.cols:
             raise ValueError("Matrix dimensions must match for addition")
         
-        result = []
-        for i in range(self.rows):
-            row = []
-            for j in range(self.cols):
-                row.append(self.data[i][j] + other.data[i][j])
-            result.append(row)
+        # Element-wise per row in C: map(add, ...) replaces the double index lookups
+        result = [list(map(add, row, other_row)) for row, other_row in zip(self.data, other.data)]
         
         return Matrix(result)
     
@@ -197,12 +298,26 @@ class Fraction:
     A fraction class with comprehensive magic methods.
     """
     
+    __slots__ = ('numerator', 'denominator')
+    
     def __init__(self, numerator: int, denominator: int = 1):
         if denominator == 0:
             raise ValueError("Denominator cannot be zero")
         
-        # Simplify the fraction
-        gcd_val = self._gcd(abs(numerator), abs(denominator))
+        # Floats become their exact integer ratio (2.5 -> 5/2), so every field stays an int
+        if type(numerator) is float or type(denominator) is float:
+            n1, d1 = float(numerator).as_integer_ratio()
+            n2, d2 = float(denominator).as_integer_ratio()
+            numerator, denominator = n1 * d2, d1 * n2
+        
+        # Whole numbers (e.g. ints coerced by the arithmetic methods) are already reduced
+        if denominator == 1:
+            self.numerator = numerator
+            self.denominator = 1
+            return
+        
+        # Simplify the fraction; math.gcd is C and ignores signs
+        gcd_val = gcd(numerator, denominator)
         self.numerator = numerator // gcd_val
         self.denominator = denominator // gcd_val
         
@@ -211,54 +326,110 @@ class Fraction:
             self.numerator = -self.numerator
             self.denominator = -self.denominator
     
-    def _gcd(self, a: int, b: int) -> int:
-        """Calculate greatest common divisor."""
-        while b:
-            a, b = b, a % b
-        return a
-    
     def __str__(self):
         return f"{self.numerator}/{self.denominator}"
     
     def __repr__(self):
         return f"Fraction({self.numerator}, {self.denominator})"
     
+    @staticmethod
+    def _coerce(other):
+        """Return other as a Fraction, or NotImplemented if it is not an int, float or Fraction."""
+        if isinstance(other, Fraction):
+            return other
+        if isinstance(other, (int, float)):
+            return Fraction(other)
+        return NotImplemented
+    
+    @classmethod
+    def _from_reduced(cls, numerator: int, denominator: int) -> 'Fraction':
+        """Build a Fraction the caller guarantees is already in lowest terms with denominator > 0."""
+        fraction = cls.__new__(cls)
+        fraction.numerator = numerator
+        fraction.denominator = denominator
+        return fraction
+    
+    def _add_or_sub(self, other, sign: int) -> 'Fraction':
+        # Work over lcm(da, db) rather than da * db, then cancel only against gcd(da, db)
+        na, da = self.numerator, self.denominator
+        nb, db = sign * other.numerator, other.denominator
+        g = gcd(da, db)
+        if g == 1:
+            return Fraction._from_reduced(na * db + nb * da, da * db)
+        s = da // g
+        t = na * (db // g) + nb * s
+        g2 = gcd(t, g)
+        return Fraction._from_reduced(t // g2, s * (db // g2))
+    
     def __add__(self, other):
-        if not isinstance(other, Fraction):
-            other = Fraction(other)
+        if type(other) is int:
+            # n/d + k = (n + k*d)/d, still in lowest terms since gcd(n + k*d, d) == gcd(n, d)
+            return Fraction._from_reduced(self.numerator + other * self.denominator, self.denominator)
+        other = Fraction._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
         
-        new_num = self.numerator * other.denominator + other.numerator * self.denominator
-        new_den = self.denominator * other.denominator
-        return Fraction(new_num, new_den)
+        return self._add_or_sub(other, 1)
     
     def __sub__(self, other):
-        if not isinstance(other, Fraction):
-            other = Fraction(other)
+        if type(other) is int:
+            return Fraction._from_reduced(self.numerator - other * self.denominator, self.denominator)
+        other = Fraction._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
         
-        new_num = self.numerator * other.denominator - other.numerator * self.denominator
-        new_den = self.denominator * other.denominator
-        return Fraction(new_num, new_den)
+        return self._add_or_sub(other, -1)
     
     def __mul__(self, other):
-        if not isinstance(other, Fraction):
-            other = Fraction(other)
+        if type(other) is int:
+            # Only the denominator can share factors with an integer
+            g = gcd(other, self.denominator)
+            return Fraction._from_reduced(self.numerator * (other // g), self.denominator // g)
+        other = Fraction._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
         
-        return Fraction(self.numerator * other.numerator, self.denominator * other.denominator)
+        # Cancel cross factors first so the products stay small and need no final gcd
+        g1 = gcd(self.numerator, other.denominator)
+        g2 = gcd(other.numerator, self.denominator)
+        return Fraction._from_reduced((self.numerator // g1) * (other.numerator // g2),
+                                      (self.denominator // g2) * (other.denominator // g1))
     
     def __truediv__(self, other):
-        if not isinstance(other, Fraction):
-            other = Fraction(other)
+        if type(other) is int:
+            if other == 0:
+                raise ValueError("Denominator cannot be zero")
+            # Only the numerator can share factors with an integer divisor
+            g = gcd(self.numerator, other)
+            numerator, denominator = self.numerator // g, self.denominator * (other // g)
+            if denominator < 0:
+                numerator, denominator = -numerator, -denominator
+            return Fraction._from_reduced(numerator, denominator)
+        other = Fraction._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        if other.numerator == 0:
+            raise ValueError("Denominator cannot be zero")
         
-        return Fraction(self.numerator * other.denominator, self.denominator * other.numerator)
+        # Multiply by the reciprocal, cancelling cross factors first as in __mul__
+        g1 = gcd(self.numerator, other.numerator)
+        g2 = gcd(other.denominator, self.denominator)
+        numerator = (self.numerator // g1) * (other.denominator // g2)
+        denominator = (self.denominator // g2) * (other.numerator // g1)
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return Fraction._from_reduced(numerator, denominator)
     
     def __eq__(self, other):
-        if not isinstance(other, Fraction):
-            other = Fraction(other)
+        other = Fraction._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
         return self.numerator == other.numerator and self.denominator == other.denominator
     
     def __lt__(self, other):
-        if not isinstance(other, Fraction):
-            other = Fraction(other)
+        other = Fraction._coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
         return self.numerator * other.denominator < other.numerator * self.denominator
     
     def __float__(self):
@@ -275,6 +446,8 @@ class ShoppingCart:
     A shopping cart class with comprehensive magic methods.
     """
     
+    __slots__ = ('items',)
+    
     def __init__(self):
         self.items = {}
     
@@ -282,6 +455,14 @@ class ShoppingCart:
         """Add an item to the cart."""
         self.items[name] = price
     
+    def total(self) -> float:
+        """Total price of the cart."""
+        # fsum sums in C with exact rounding, so totals don't pick up float drift
+        return math.fsum(self.items.values())
+    
+    def __float__(self):
+        return self.total()
+    
     def __len__(self):
         return len(self.items)
     
@@ -1,5 +1,5 @@
 import pytest
-from magic_methods import Vector, Matrix, Fraction, ShoppingCart
+from magic_methods import Vector, VectorArray, Matrix, Fraction, ShoppingCart
 
 def test_vector_creation():
     v = Vector(1, 2, 3)
@@ -86,6 +86,22 @@ def test_vector_boolean():
     assert not v1
     assert v2
 
+def test_vector_array_arithmetic():
+    a = VectorArray.from_vectors([Vector(1, 2, 3), Vector(3, 4, 0)])
+    b = VectorArray([1, 0], [0, 1], [0, 0])
+    
+    assert len(a) == 2
+    assert a[1] == Vector(3, 4, 0)
+    assert list(a + b) == [Vector(2, 2, 3), Vector(3, 5, 0)]
+    assert list(2 * a) == [Vector(2, 4, 6), Vector(6, 8, 0)]
+    assert list(a.dot(b)) == [1.0, 4.0]
+    assert list(a.cross(b)) == [Vector(1, 2, 3).cross(Vector(1, 0, 0)), Vector(3, 4, 0).cross(Vector(0, 1, 0))]
+    assert abs(a)[1] == 5.0
+
+def test_vector_array_length_mismatch():
+    with pytest.raises(ValueError):
+        VectorArray([1, 2], [1], [1])
+
 def test_matrix_creation():
     m = Matrix([[1, 2], [3, 4]])
     assert m.rows == 2
@@ -121,6 +137,32 @@ def test_fraction_arithmetic():
     assert f3.numerator == 5
     assert f3.denominator == 6
 
+def test_fraction_arithmetic_stays_reduced():
+    assert (Fraction(1, 6) + Fraction(1, 3)) == Fraction(1, 2)
+    assert (Fraction(1, 2) - Fraction(1, 2)).denominator == 1
+    product = Fraction(4, 9) * Fraction(3, 8)
+    assert (product.numerator, product.denominator) == (1, 6)
+    quotient = Fraction(2, 3) / Fraction(-4, 9)
+    assert (quotient.numerator, quotient.denominator) == (-3, 2)
+
+def test_fraction_integer_operands():
+    f = Fraction(3, 4)
+    assert f + 1 == Fraction(7, 4)
+    assert f - 1 == Fraction(-1, 4)
+    assert f * 2 == Fraction(3, 2)
+    assert f / -3 == Fraction(-1, 4)
+
+def test_fraction_float_operands():
+    f = Fraction(1, 2)
+    assert float(f * 2.5) == 1.25
+    assert f + 0.25 == Fraction(3, 4)
+    assert f / 0.5 == 1
+    assert f == 0.5
+    assert Fraction(2.5) == Fraction(5, 2)
+    
+    with pytest.raises(TypeError):
+        f - "1"
+
 def test_fraction_comparison():
     f1 = Fraction(1, 2)
     f2 = Fraction(2, 4)
@@ -154,6 +196,14 @@ def test_shopping_cart():
     total = sum(cart)
     assert total == 2.25
 
+def test_shopping_cart_total():
+    cart = ShoppingCart()
+    for i in range(10):
+        cart.add_item(f"item{i}", 0.1)
+    
+    assert cart.total() == 1.0
+    assert float(cart) == 1.0
+
 def test_shopping_cart_callable():
     cart = ShoppingCart()
     cart.add_item("apple", 1.50)
@@ -168,3 +218,6 @@ def test_shopping_cart_boolean():
     assert not cart1
     assert cart2
 
+def test_value_types_have_no_instance_dict():
+    for obj in (Vector(1, 2, 3), VectorArray(), Matrix([[1]]), Fraction(1, 2), ShoppingCart()):
+        assert not hasattr(obj, '__dict__')
@@ -1,3 +1,15 @@
+import os
+import time
+import functools
+import itertools
+import timeit
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Largest finite single-precision float, the limit for packing into array('f')
+FLOAT32_MAX = 3.4028234663852886e38
+
+
 class PerformanceOptimizer:
     """
     A class for learning performance optimization through TDD.
@@ -30,9 +42,31 @@ class PerformanceOptimizer:
         """Benchmark multiple functions with the same test data."""
         pass
     
-    def cache_results(self, ttl=None):
-        """Decorator to cache function results."""
-        pass
+    def cache_results(self, ttl=None, maxsize=128):
+        """
+        Decorator to cache function results.
+        
+        Built on functools.lru_cache, whose lookup is implemented in C. With
+        ttl (seconds), the current time bucket is part of the cache key, so
+        entries stop matching once the bucket rolls over: a result lives at
+        most ttl seconds, and stale entries age out of the LRU.
+        """
+        def decorator(func):
+            if ttl is None:
+                return functools.lru_cache(maxsize=maxsize)(func)
+            
+            @functools.lru_cache(maxsize=maxsize)
+            def cached(bucket, *args, **kwargs):
+                return func(*args, **kwargs)
+            
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return cached(int(time.monotonic() // ttl), *args, **kwargs)
+            
+            wrapper.cache_info = cached.cache_info
+            wrapper.cache_clear = cached.cache_clear
+            return wrapper
+        return decorator
     
     def memoize_recursive(self, func):
         """Memoize recursive functions."""
@@ -42,21 +76,83 @@ class PerformanceOptimizer:
         """Optimize loop operations."""
         pass
     
-    def parallel_map(self, func, iterable, workers=None):
-        """Apply function to iterable using parallel processing."""
-        pass
+    def parallel_map(self, func, iterable, workers=None, io_bound=False):
+        """
+        Apply function to iterable using parallel processing.
+        
+        CPU-bound work runs in worker processes to get past the GIL, so func
+        and the items must be picklable (a module-level function, not a
+        lambda). Pass io_bound=True for work that mostly waits (network,
+        disk) to use threads instead, which start faster and need no pickling.
+        """
+        items = list(iterable)
+        if not items:
+            return []
+        workers = workers or os.cpu_count() or 1
+        if io_bound:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(func, items))
+        # About four chunks per worker: big enough to amortize the per-task
+        # pickling/IPC round trip, small enough to keep the workers balanced
+        chunksize = max(1, len(items) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items, chunksize=chunksize))
     
     def batch_process(self, data, batch_size, processor):
-        """Process data in batches for memory efficiency."""
-        pass
+        """
+        Process data in batches for memory efficiency.
+        
+        Yields processor(batch) for each batch. Buffer-protocol data (bytes,
+        bytearray, array.array) is batched as memoryview slices, which are
+        views rather than copies; anything else, including generators, is
+        consumed incrementally with islice so the whole input is never
+        materialized.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        
+        try:
+            view = memoryview(data)
+        except TypeError:
+            iterator = iter(data)
+            while batch := list(itertools.islice(iterator, batch_size)):
+                yield processor(batch)
+        else:
+            for start in range(0, len(view), batch_size):
+                yield processor(view[start:start + batch_size])
     
     def lazy_evaluation(self, data_generator):
         """Implement lazy evaluation for large datasets."""
         pass
     
-    def optimize_memory_usage(self, data):
-        """Optimize memory usage for large data structures."""
-        pass
+    def optimize_memory_usage(self, data, allow_float32=False):
+        """
+        Optimize memory usage for large data structures.
+        
+        A list of ints is packed into the narrowest signed array typecode that
+        holds its range ('b', 'h', 'i' or 'q'); a list of floats into array('d'),
+        or array('f') when allow_float32 is set and the precision loss is
+        acceptable. Packed items are raw machine numbers, not 24-32 byte
+        Python objects plus an 8-byte list pointer each. Anything else is
+        returned unchanged.
+        """
+        if not isinstance(data, list) or not data:
+            return data
+        
+        if all(type(item) is int for item in data):
+            low, high = min(data), max(data)
+            for typecode in ('b', 'h', 'i', 'q'):
+                bits = array(typecode).itemsize * 8
+                if -(1 << (bits - 1)) <= low and high < (1 << (bits - 1)):
+                    return array(typecode, data)
+            return data
+        
+        if all(type(item) is float for item in data):
+            if allow_float32 and all(abs(item) <= FLOAT32_MAX for item in data):
+                return array('f', data)
+            return array('d', data)
+        
+        return data
     
     def find_bottlenecks(self, profile_data):
         """Analyze profile data to find performance bottlenecks."""
@@ -66,6 +162,26 @@ class PerformanceOptimizer:
         """Compare performance of different algorithms."""
         pass
     
-    def measure_complexity(self, func, input_sizes):
-        """Measure time complexity of a function."""
-        pass
+    def measure_complexity(self, func, input_sizes, make_input=None):
+        """
+        Measure time complexity of a function.
+        
+        For each size n, func is called on make_input(n) (default:
+        list(range(n))) and the best per-call time in seconds is recorded.
+        One untimed call warms caches first; timeit's autorange then picks
+        a loop count long enough to rise above timer resolution, and the
+        minimum of several repeats filters out scheduler noise.
+        
+        Returns:
+            dict: {n: seconds per call}
+        """
+        make_input = make_input or (lambda n: list(range(n)))
+        results = {}
+        for n in input_sizes:
+            data = make_input(n)
+            func(data)  # warm-up, excluded from timing
+            # timeit's default clock is time.perf_counter: monotonic and high resolution
+            timer = timeit.Timer(lambda: func(data))
+            number, _ = timer.autorange()
+            results[n] = min(timer.repeat(repeat=5, number=number)) / number
+        return results
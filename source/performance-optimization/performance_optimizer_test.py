@@ -1,3 +1,60 @@
+from performance_optimizer import PerformanceOptimizer
+
+
 def test_performance_optimizer_placeholder():
     """Placeholder test for performance optimization module."""
     assert True
+
+def test_parallel_map():
+    optimizer = PerformanceOptimizer()
+    assert optimizer.parallel_map(abs, [-1, 2, -3, 4], workers=2) == [1, 2, 3, 4]
+    assert optimizer.parallel_map(str.upper, ["a", "b"], io_bound=True) == ["A", "B"]
+    assert optimizer.parallel_map(abs, []) == []
+
+def test_cache_results(monkeypatch):
+    optimizer = PerformanceOptimizer()
+    calls = []
+    
+    @optimizer.cache_results()
+    def square(n):
+        calls.append(n)
+        return n * n
+    
+    assert square(4) == 16
+    assert square(4) == 16
+    assert calls == [4]
+    
+    now = [100.0]
+    monkeypatch.setattr("performance_optimizer.time.monotonic", lambda: now[0])
+    
+    @optimizer.cache_results(ttl=10)
+    def cube(n):
+        calls.append(n)
+        return n ** 3
+    
+    assert cube(2) == 8
+    assert cube(2) == 8
+    assert calls == [4, 2]
+    now[0] += 10
+    assert cube(2) == 8
+    assert calls == [4, 2, 2]
+
+def test_batch_process():
+    optimizer = PerformanceOptimizer()
+    assert list(optimizer.batch_process(range(7), 3, sum)) == [3, 12, 6]
+    assert list(optimizer.batch_process(b"abcde", 2, bytes)) == [b"ab", b"cd", b"e"]
+
+def test_optimize_memory_usage():
+    optimizer = PerformanceOptimizer()
+    assert optimizer.optimize_memory_usage([1, -5, 100]).typecode == 'b'
+    assert optimizer.optimize_memory_usage([1, 70000]).typecode in ('i', 'q')
+    assert optimizer.optimize_memory_usage([0.5, 1.5]).typecode == 'd'
+    assert optimizer.optimize_memory_usage([0.5, 1.5], allow_float32=True).typecode == 'f'
+    assert optimizer.optimize_memory_usage(["a", 1]) == ["a", 1]
+    assert list(optimizer.optimize_memory_usage([300, -2])) == [300, -2]
+
+def test_measure_complexity():
+    optimizer = PerformanceOptimizer()
+    results = optimizer.measure_complexity(sum, [10, 10000])
+    assert set(results) == {10, 10000}
+    assert 0 < results[10] < results[10000]
@@ -1,13 +1,30 @@
 import math
 import re
-from typing import Optional, Any, Callable
-from functools import wraps
+from array import array
+from typing import Optional, Any, Callable, Iterable
+# functools.cached_property stores the value in the instance __dict__ under the
+# property's own name, so every later read is a plain attribute lookup
+from functools import cached_property
+
+# Compiled once at import: the database_url setter validates on every write
+_URL_RE = re.compile(
+    r'https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)', re.IGNORECASE)
+
+ABSOLUTE_ZERO_C = -273.15
+KELVIN_OFFSET = 273.15
 
 class Temperature:
     """
     A temperature class with properties for different units.
     """
     
+    __slots__ = ('_celsius',)
+    
     def __init__(self, celsius: float = 0.0):
         self._celsius = celsius
     
@@ -19,34 +36,36 @@ class Temperature:
     @celsius.setter
     def celsius(self, value: float):
         """Set temperature in Celsius."""
-        if value < -273.15:  # Absolute zero
+        if value < ABSOLUTE_ZERO_C:
             raise ValueError("Temperature cannot be below absolute zero (-273.15°C)")
         self._celsius = value
     
     @property
     def fahrenheit(self) -> float:
         """Get temperature in Fahrenheit."""
-        return self._celsius * 9/5 + 32
+        # Float literals skip the int-to-float coercion on each operator.
+        # Keep * 9 / 5 rather than * 1.8: 37°C must give 98.6, not 98.60000000000001
+        return self._celsius * 9.0 / 5.0 + 32.0
     
     @fahrenheit.setter
     def fahrenheit(self, value: float):
         """Set temperature in Fahrenheit."""
-        celsius = (value - 32) * 5/9
-        if celsius < -273.15:
+        celsius = (value - 32.0) * 5.0 / 9.0
+        if celsius < ABSOLUTE_ZERO_C:
             raise ValueError("Temperature cannot be below absolute zero")
         self._celsius = celsius
     
     @property
     def kelvin(self) -> float:
         """Get temperature in Kelvin."""
-        return self._celsius + 273.15
+        return self._celsius + KELVIN_OFFSET
     
     @kelvin.setter
     def kelvin(self, value: float):
         """Set temperature in Kelvin."""
         if value < 0:
             raise ValueError("Temperature cannot be below absolute zero (0K)")
-        self._celsius = value - 273.15
+        self._celsius = value - KELVIN_OFFSET
     
     def __str__(self):
         return f"{self._celsius:.2f}°C"
@@ -57,10 +76,20 @@ class Temperature:
 class Circle:
     """
     A circle class with radius, diameter, area, and circumference properties.
+    
+    Area and circumference are computed when the radius changes rather than
+    on every read, since a circle is typically read far more than it is resized.
     """
     
+    __slots__ = ('_radius', '_area', '_circumference')
+    
     def __init__(self, radius: float = 1.0):
+        self._set_radius(radius)
+    
+    def _set_radius(self, radius: float):
         self._radius = radius
+        self._area = math.pi * radius * radius
+        self._circumference = 2 * math.pi * radius
     
     @property
     def radius(self) -> float:
@@ -72,7 +101,7 @@ class Circle:
         """Set the radius."""
         if value < 0:
             raise ValueError("Radius cannot be negative")
-        self._radius = value
+        self._set_radius(value)
     
     @property
     def diameter(self) -> float:
@@ -84,17 +113,17 @@ class Circle:
         """Set the diameter."""
         if value < 0:
             raise ValueError("Diameter cannot be negative")
-        self._radius = value / 2
+        self._set_radius(value / 2)
     
     @property
     def area(self) -> float:
         """Get the area."""
-        return math.pi * self._radius ** 2
+        return self._area
     
     @property
     def circumference(self) -> float:
         """Get the circumference."""
-        return 2 * math.pi * self._radius
+        return self._circumference
     
     def __str__(self):
         return f"Circle(radius={self._radius:.2f})"
@@ -102,11 +131,97 @@ class Circle:
     def __repr__(self):
         return f"Circle({self._radius})"
 
+class CircleArray:
+    """
+    Many circles stored as one packed array('d') of radii (structure of arrays).
+    
+    N circles cost one buffer of 8-byte doubles instead of N Circle objects,
+    and area/circumference are computed for all of them in one pass.
+    """
+    
+    __slots__ = ('radii',)
+    
+    def __init__(self, radii: Iterable[float] = ()):
+        self.radii = array('d', radii)
+        if self.radii and min(self.radii) < 0:
+            raise ValueError("Radius cannot be negative")
+    
+    @classmethod
+    def from_circles(cls, circles: Iterable[Circle]) -> 'CircleArray':
+        """Pack Circle objects into one radius column."""
+        return cls(circle.radius for circle in circles)
+    
+    def __len__(self):
+        return len(self.radii)
+    
+    def __getitem__(self, index):
+        return Circle(self.radii[index])
+    
+    def __iter__(self):
+        return map(Circle, self.radii)
+    
+    @property
+    def areas(self) -> array:
+        """Areas of all circles, in the same order as the radii."""
+        pi = math.pi
+        return array('d', [pi * r * r for r in self.radii])
+    
+    @property
+    def circumferences(self) -> array:
+        """Circumferences of all circles, in the same order as the radii."""
+        tau = 2 * math.pi
+        return array('d', [tau * r for r in self.radii])
+    
+    def __repr__(self):
+        return f"CircleArray({len(self)} circles)"
+
+class TemperatureArray:
+    """
+    Many temperatures stored as one packed array('d') of Celsius values.
+    """
+    
+    __slots__ = ('celsius',)
+    
+    def __init__(self, celsius: Iterable[float] = ()):
+        self.celsius = array('d', celsius)
+        if self.celsius and min(self.celsius) < ABSOLUTE_ZERO_C:
+            raise ValueError("Temperature cannot be below absolute zero (-273.15°C)")
+    
+    @classmethod
+    def from_temperatures(cls, temperatures: Iterable[Temperature]) -> 'TemperatureArray':
+        """Pack Temperature objects into one Celsius column."""
+        return cls(temperature.celsius for temperature in temperatures)
+    
+    def __len__(self):
+        return len(self.celsius)
+    
+    def __getitem__(self, index):
+        return Temperature(self.celsius[index])
+    
+    def __iter__(self):
+        return map(Temperature, self.celsius)
+    
+    @property
+    def fahrenheit(self) -> array:
+        """All temperatures in Fahrenheit, converted exactly as Temperature.fahrenheit does."""
+        return array('d', [c * 9.0 / 5.0 + 32.0 for c in self.celsius])
+    
+    @property
+    def kelvin(self) -> array:
+        """All temperatures in Kelvin."""
+        offset = KELVIN_OFFSET
+        return array('d', [c + offset for c in self.celsius])
+    
+    def __repr__(self):
+        return f"TemperatureArray({len(self)} temperatures)"
+
 class BankAccount:
     """
     A bank account class with balance validation.
     """
     
+    __slots__ = ('account_number', 'owner', '_balance')
+    
     def __init__(self, account_number: str, owner: str, initial_balance: float = 0.0):
         self.account_number = account_number
         self.owner = owner
@@ -137,10 +252,37 @@ class Person:
     A person class with name and age properties.
     """
     
+    # _is_adult is kept in step with _age, so the check is a plain read
+    __slots__ = ('_first_name', '_last_name', '_age', '_is_adult', '_full_name')
+    
     def __init__(self, first_name: str, last_name: str, age: int = 0):
-        self.first_name = first_name
-        self.last_name = last_name
+        self._first_name = first_name
+        self._last_name = last_name
         self._age = age
+        self._is_adult = age >= 18
+        self._full_name = None
+    
+    @property
+    def first_name(self) -> str:
+        """Get the first name."""
+        return self._first_name
+    
+    @first_name.setter
+    def first_name(self, value: str):
+        """Set the first name."""
+        self._first_name = value
+        self._full_name = None
+    
+    @property
+    def last_name(self) -> str:
+        """Get the last name."""
+        return self._last_name
+    
+    @last_name.setter
+    def last_name(self, value: str):
+        """Set the last name."""
+        self._last_name = value
+        self._full_name = None
     
     @property
     def age(self) -> int:
@@ -155,21 +297,26 @@ class Person:
         if value > 150:
             raise ValueError("Age cannot be greater than 150")
         self._age = value
+        self._is_adult = value >= 18
     
     @age.deleter
     def age(self):
         """Delete the age (reset to 0)."""
         self._age = 0
+        self._is_adult = False
     
     @property
     def full_name(self) -> str:
-        """Get the full name."""
-        return f"{self.first_name} {self.last_name}"
+        """Get the full name, built once and reused until a name changes."""
+        full_name = self._full_name
+        if full_name is None:
+            full_name = self._full_name = f"{self._first_name} {self._last_name}"
+        return full_name
     
     @property
     def is_adult(self) -> bool:
         """Check if the person is an adult."""
-        return self._age >= 18
+        return self._is_adult
     
     def __str__(self):
         return f"Person({self.full_name}, {self._age})"
@@ -179,6 +326,8 @@ class ConfigManager:
     A configuration manager with validation.
     """
     
+    __slots__ = ('_database_url', '_api_key')
+    
     def __init__(self):
         self._database_url = ""
         self._api_key = ""
@@ -214,27 +363,7 @@ class ConfigManager:
     
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format."""
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return bool(url_pattern.match(url))
-
-def cached_property(func):
-    """
-    A decorator that caches the result of a property.
-    """
-    @wraps(func)
-    def wrapper(self):
-        if not hasattr(self, '_cache'):
-            self._cache = {}
-        if func.__name__ not in self._cache:
-            self._cache[func.__name__] = func(self)
-        return self._cache[func.__name__]
-    return property(wrapper)
+        return _URL_RE.fullmatch(url) is not None
 
 class ExpensiveCalculation:
     """
@@ -248,10 +377,11 @@ class ExpensiveCalculation:
     def expensive_value(self):
         """An expensive calculation that should be cached."""
         self.calculation_count += 1
-        return sum(range(1000000))
+        # Sum of 0..n-1 in closed form; calculation_count is what shows the caching
+        n = 1000000
+        return n * (n - 1) // 2
     
     def clear_cache(self):
         """Clear the cached values."""
-        if hasattr(self, '_cache'):
-            self._cache.clear()
+        self.__dict__.pop('expensive_value', None)
 
@@ -1,7 +1,7 @@
 import pytest
 import math
 from properties import (Temperature, Circle, BankAccount, Person, ConfigManager, 
-                       ExpensiveCalculation, cached_property)
+                       ExpensiveCalculation, cached_property, CircleArray, TemperatureArray)
 
 def test_temperature_celsius_property():
     temp = Temperature(25)
@@ -45,6 +45,13 @@ def test_circle_diameter_property():
     assert circle.radius == 10
     assert circle.diameter == 20
 
+def test_circle_derived_values_follow_radius():
+    circle = Circle(1)
+    circle.radius = 3
+    assert circle.area == math.pi * 9
+    circle.diameter = 4
+    assert circle.circumference == 4 * math.pi
+
 def test_circle_validation():
     circle = Circle()
     
@@ -54,6 +61,28 @@ def test_circle_validation():
     with pytest.raises(ValueError):
         circle.diameter = -10
 
+def test_circle_array_matches_circles():
+    radii = [0.5, 1, 2.5, 10]
+    circles = CircleArray(radii)
+    assert len(circles) == 4
+    assert list(circles.areas) == [Circle(r).area for r in radii]
+    assert list(circles.circumferences) == [Circle(r).circumference for r in radii]
+    assert CircleArray.from_circles(circles).radii == circles.radii
+    assert circles[2].radius == 2.5
+    
+    with pytest.raises(ValueError):
+        CircleArray([1, -1])
+
+def test_temperature_array_matches_temperatures():
+    values = [-40, 0, 25, 37, 100]
+    temperatures = TemperatureArray(values)
+    assert list(temperatures.fahrenheit) == [Temperature(c).fahrenheit for c in values]
+    assert list(temperatures.kelvin) == [Temperature(c).kelvin for c in values]
+    assert temperatures[3].celsius == 37
+    
+    with pytest.raises(ValueError):
+        TemperatureArray([-300])
+
 def test_bank_account_properties():
     account = BankAccount("12345", "John Doe", 1000.0)
     assert account.account_number == "12345"
@@ -84,6 +113,27 @@ def test_person_age_validation():
     with pytest.raises(ValueError):
         person.age = 150
 
+def test_person_full_name_follows_name_changes():
+    person = Person("John", "Doe", 30)
+    assert person.full_name == "John Doe"
+    person.first_name = "Jane"
+    assert person.full_name == "Jane Doe"
+    person.last_name = "Smith"
+    assert person.full_name == "Jane Smith"
+
+def test_cached_flags_follow_setters():
+    person = Person("Jane", "Doe", 17)
+    assert person.is_adult == False
+    person.age = 18
+    assert person.is_adult == True
+    del person.age
+    assert person.is_adult == False
+    
+    account = BankAccount("1", "Jane", -5.0)
+    assert account.is_overdrawn == True
+    account.balance = 10.0
+    assert account.is_overdrawn == False
+
 def test_config_manager_properties():
     config = ConfigManager()
     config.database_url = "postgresql://localhost:5432/mydb"
@@ -119,7 +169,7 @@ def test_cached_property():
     # Second access should use cached value
     value2 = calc.expensive_value
     assert calc.calculation_count == 1
-    assert value1 == value2
+    assert value1 == value2 == sum(range(1000000))
 
 def test_cached_property_clear():
     calc = ExpensiveCalculation()
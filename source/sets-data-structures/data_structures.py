@@ -1,3 +1,13 @@
+from collections import Counter, defaultdict, deque
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
+def _cached_intersection(set1, set2):
+    # Only frozensets reach here: they are hashable and cache their hash after the first call
+    return set1 & set2
+
+
 class DataStructures:
     """
     A class for learning Python data structures through TDD.
@@ -24,31 +34,49 @@ class DataStructures:
     
     def get_unique_items(self, items):
         """Return unique items from a list as a set."""
-        pass
+        return set(items)
     
     def find_common_elements(self, set1, set2):
-        """Find common elements between two sets (intersection)."""
-        pass
+        """
+        Find common elements between two sets (intersection).
+        
+        Pairs of frozensets (e.g. fixed vocabularies queried repeatedly) are
+        memoized; mutable sets can change between calls, so they are always
+        intersected afresh. Either way & already iterates the smaller set.
+        """
+        if type(set1) is frozenset and type(set2) is frozenset:
+            return _cached_intersection(set1, set2)
+        return set1 & set2
     
     def union_sets(self, set1, set2):
         """Return union of two sets."""
-        pass
+        return set1 | set2
     
     def difference_sets(self, set1, set2):
         """Return elements in set1 but not in set2."""
-        pass
+        return set1 - set2
     
     def symmetric_difference(self, set1, set2):
         """Return elements in either set but not both."""
-        pass
+        return set1 ^ set2
     
     def is_subset(self, set1, set2):
         """Check if set1 is a subset of set2."""
-        pass
+        return set1 <= set2
     
     def find_duplicates(self, items):
         """Find duplicate items in a list."""
-        pass
+        # One pass with two sets: no per-item counts are kept, only membership
+        seen = set()
+        duplicates = set()
+        add_seen = seen.add
+        add_duplicate = duplicates.add
+        for item in items:
+            if item in seen:
+                add_duplicate(item)
+            else:
+                add_seen(item)
+        return duplicates
     
     def create_person(self, name, age, job):
         """Create a Person named tuple."""
@@ -60,44 +88,60 @@ class DataStructures:
     
     def count_words(self, text):
         """Count word frequencies in text."""
-        pass
+        # Counter consumes the list in C; str.split beats a \w+ regex findall by ~2x here
+        return Counter(text.split())
     
     def count_characters(self, text):
         """Count character frequencies in text."""
-        pass
+        return Counter(text)
     
     def most_common_items(self, items, n):
         """Return the n most common items and their counts."""
-        pass
+        return Counter(items).most_common(n)
     
     def merge_counters(self, counters):
         """Merge multiple Counter objects."""
-        pass
-    
-    def create_queue(self):
-        """Create an empty deque for queue/stack operations."""
-        pass
+        # update() adds in place; sum(counters, Counter()) would build a new Counter per step
+        merged = Counter()
+        for counter in counters:
+            merged.update(counter)
+        return merged
+    
+    def create_queue(self, maxlen=None):
+        """
+        Create an empty deque for queue/stack operations.
+        
+        A deque pops from either end in O(1), where list.pop(0) shifts every
+        remaining element. With maxlen set, appending to a full deque drops
+        the item at the opposite end, giving a fixed-size ring buffer.
+        """
+        return deque(maxlen=maxlen)
     
     def enqueue(self, queue, item):
         """Add item to the right end of queue (FIFO)."""
-        pass
+        queue.append(item)
     
     def dequeue(self, queue):
-        """Remove and return item from left end of queue (FIFO)."""
-        pass
+        """Remove and return item from left end of queue (FIFO). Raises IndexError if empty."""
+        return queue.popleft()
     
     def push(self, stack, item):
         """Push item onto stack (LIFO)."""
-        pass
+        stack.append(item)
     
     def pop(self, stack):
         """Pop item from stack (LIFO)."""
-        pass
+        return stack.pop()
     
     def group_by_length(self, words):
         """Group words by their length using defaultdict."""
-        pass
+        # Plain subscripting: 3.11 specializes dict[key], so binding __getitem__ is slower
+        groups = defaultdict(list)
+        for word in words:
+            groups[len(word)].append(word)
+        return groups
     
     def count_by_first_letter(self, words):
         """Count words by their first letter."""
-        pass
+        # A list comprehension feeds Counter faster than a generator; empty strings have no first letter
+        return Counter([word[0] for word in words if word])
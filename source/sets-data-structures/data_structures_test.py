@@ -41,6 +41,16 @@ class TestSets:
         result = ds.find_common_elements(set1, set2)
         assert result == set()
     
+    def test_find_common_elements_frozensets(self):
+        """Should intersect frozensets, reusing the result for repeated pairs."""
+        ds = DataStructures()
+        vocabulary = frozenset({"cat", "dog", "bird"})
+        words = frozenset({"dog", "fish", "cat"})
+        
+        first = ds.find_common_elements(vocabulary, words)
+        assert first == {"cat", "dog"}
+        assert ds.find_common_elements(vocabulary, words) is first
+    
     def test_union_sets(self):
         """Should return union of two sets."""
         ds = DataStructures()
@@ -165,6 +175,17 @@ class TestDeque:
         with pytest.raises(IndexError):
             ds.dequeue(queue)
 
+    
+    def test_bounded_queue_drops_oldest(self):
+        """Should keep only the newest items when maxlen is set."""
+        ds = DataStructures()
+        queue = ds.create_queue(maxlen=2)
+        
+        for item in ("first", "second", "third"):
+            ds.enqueue(queue, item)
+        
+        assert list(queue) == ["second", "third"]
+        assert ds.dequeue(queue) == "second"
 
 class TestDefaultDict:
     """Test defaultdict functionality."""